@@ -0,0 +1,37 @@
+"""
+Lazy access to the optional Numba JIT.
+
+Importing numba costs far more than the rest of the package, so kernels
+are built on their first call rather than at import time.
+"""
+
+from functools import lru_cache, update_wrapper
+
+
+@lru_cache(maxsize=None)
+def load_njit():
+    """Return numba.njit, or None when numba is not installed."""
+    try:
+        from numba import njit
+    except ImportError:  # optional accelerator
+        return None
+    return njit
+
+
+def lazy_kernel(build):
+    """
+    Decorate a kernel builder so the kernel is built on first call.
+
+    build(njit) receives numba.njit (or None without numba) and returns
+    the callable used for this and every later call.
+    """
+    kernel = None
+
+    def call(*args):
+        nonlocal kernel
+        if kernel is None:
+            kernel = build(load_njit())
+        return kernel(*args)
+    # Name and docstring only: no __wrapped__, whose signature would be build's
+    return update_wrapper(call, build, updated=(),
+                          assigned=('__module__', '__name__', '__qualname__', '__doc__'))
@@ -3,9 +3,9 @@ METEORICA Parameters Module
 Contains the seven core parameters for meteorite classification.
 """
 
-from .mcc import calculate_mcc
+from .mcc import calculate_mcc, calculate_mcc_batch
 from .smg import calculate_smg
-from .twi import calculate_twi, estimate_terrestrial_age
+from .twi import calculate_twi, calculate_twi_batch, estimate_terrestrial_age
 from .iaf import calculate_iaf
 from .atp import calculate_atp
 from .pbdr import calculate_pbdr
@@ -13,8 +13,10 @@ from .cnea import calculate_cnea
 
 __all__ = [
     "calculate_mcc",
+    "calculate_mcc_batch",
     "calculate_smg",
     "calculate_twi",
+    "calculate_twi_batch",
     "estimate_terrestrial_age",
     "calculate_iaf",
     "calculate_atp",
@@ -0,0 +1,40 @@
+"""
+Distance kernels for the 7D isotope space used by IAF.
+Compiled with Numba on first use when it is installed, plain NumPy otherwise.
+"""
+
+import numpy as np
+
+from .._jit import lazy_kernel
+
+
+def _sqdist7_numpy(a: np.ndarray, b: np.ndarray, i: int) -> float:
+    """Squared Euclidean distance between a and row i of b."""
+    d = a - b[i]
+    return float(d @ d)
+
+
+@lazy_kernel
+def sqdist7(njit):
+    """Squared Euclidean distance between a and row i of b, unrolled over 7 lanes."""
+    if njit is None:
+        return _sqdist7_numpy
+
+    @njit(inline='always', fastmath=True, cache=True)
+    def kernel(a, b, i):
+        d = a[0] - b[i, 0]
+        s = d * d
+        d = a[1] - b[i, 1]
+        s += d * d
+        d = a[2] - b[i, 2]
+        s += d * d
+        d = a[3] - b[i, 3]
+        s += d * d
+        d = a[4] - b[i, 4]
+        s += d * d
+        d = a[5] - b[i, 5]
+        s += d * d
+        d = a[6] - b[i, 6]
+        s += d * d
+        return s
+    return kernel
@@ -3,9 +3,12 @@ Isotopic Anomaly Fingerprint (IAF)
 7-dimensional nucleosynthetic space for group discrimination.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 
+from ._iaf_kernels import sqdist7
+
 # Group centroids in 7D isotope space
 # Format: (ε⁵⁰Ti, ε⁵⁴Cr, ε⁹⁶Mo, ε¹⁰⁰Mo, ε⁹²Ru, ε¹³⁷Ba, ε¹⁴²Nd)
 GROUP_ISOTOPE_CENTROIDS = {
@@ -21,6 +24,12 @@ GROUP_ISOTOPE_CENTROIDS = {
     'EL': np.array([-0.15, -0.05, 0.0, 0.0, 0.0, 0.0, 0.0]),
 }
 
+# Centroids stacked into one C-contiguous (n_groups, 7) matrix for the kernel
+_GROUP_NAMES = tuple(GROUP_ISOTOPE_CENTROIDS)
+_CENTROID_MATRIX = np.ascontiguousarray(
+    np.stack([GROUP_ISOTOPE_CENTROIDS[g] for g in _GROUP_NAMES]), dtype=np.float64
+)
+
 # Intra-group dispersion (sigma) for each group
 GROUP_DISPERSION = {
     'CI': 0.5,
@@ -68,7 +77,7 @@ def calculate_iaf(isotope_data: Dict[str, float]) -> Dict[str, any]:
         isotope_data.get('ε⁹²Ru', 0),
         isotope_data.get('ε¹³⁷Ba', 0),
         isotope_data.get('ε¹⁴²Nd', 0),
-    ])
+    ], dtype=np.float64)
     
     min_distance = float('inf')
     best_group = None
@@ -76,15 +85,15 @@ def calculate_iaf(isotope_data: Dict[str, float]) -> Dict[str, any]:
     all_distances = {}
     
     # Calculate distance to each group centroid
-    for group, centroid in GROUP_ISOTOPE_CENTROIDS.items():
+    for i, group in enumerate(_GROUP_NAMES):
         # Euclidean distance in isotope space
-        distance = np.sqrt(np.sum((obs - centroid) ** 2))
+        distance = math.sqrt(sqdist7(obs, _CENTROID_MATRIX, i))
         all_distances[group] = distance
         
         if distance < min_distance:
             min_distance = distance
             best_group = group
-            best_centroid = centroid
+            best_centroid = GROUP_ISOTOPE_CENTROIDS[group]
     
     # Get dispersion for best group
     sigma = GROUP_DISPERSION.get(best_group, 0.5)
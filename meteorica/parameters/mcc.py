@@ -138,6 +138,45 @@ def _calculate_mcc_stony(mineral_data: Dict[str, float],
     }
 
 
+def calculate_mcc_batch(fa: np.ndarray, fs: np.ndarray,
+                        d17o: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Calculate MCC for many stony specimens at once.
+    
+    Vectorized equivalent of calling calculate_mcc on each
+    (fa, fs, d17O) record, with inputs given as column arrays.
+    
+    Args:
+        fa: Olivine Fa mol% per specimen
+        fs: Pyroxene Fs mol% per specimen
+        d17o: Δ¹⁷O permil per specimen
+        
+    Returns:
+        Dictionary with 'mcc', 'group' and 'distance' arrays
+    """
+    obs = np.column_stack([fa, fs, d17o]).astype(np.float64)
+    
+    groups = [g for g, c in GROUP_CENTROIDS.items() if c['fa'] is not None]
+    centroids = np.array([[GROUP_CENTROIDS[g]['fa'], GROUP_CENTROIDS[g]['fs'],
+                           GROUP_CENTROIDS[g]['d17O']] for g in groups])
+    inv_covs = np.linalg.inv(np.stack([GROUP_COVARIANCES.get(g, np.eye(3) * 2.0)
+                                       for g in groups]))
+    
+    # (n_specimens, n_groups, 3) differences, squared distances per group
+    diff = obs[:, None, :] - centroids[None, :, :]
+    d2 = np.einsum('ngi,gij,ngj->ng', diff, inv_covs, diff)
+    
+    best = np.argmin(d2, axis=1)
+    distances = np.sqrt(d2[np.arange(len(obs)), best])
+    
+    d_max = 5.0  # Maximum tolerable distance (calibrated from research)
+    return {
+        'mcc': np.maximum(0, 1 - distances / d_max),
+        'group': np.array(groups)[best],
+        'distance': distances
+    }
+
+
 def _calculate_mcc_iron(mineral_data: Dict[str, float], 
                         group: Optional[str] = None) -> Dict[str, any]:
     """Calculate MCC for iron meteorites."""
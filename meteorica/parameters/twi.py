@@ -6,6 +6,39 @@ Terrestrial Weathering Index (TWI)
 import numpy as np
 from typing import Dict, Optional
 
+from .._jit import lazy_kernel
+
+# Corrected weights from research paper, in indicator order
+_TWI_KEYS = ('metal_oxidation', 'phyllosilicate', 'carbonate_veins',
+             'be_ne_deviation', 'fe_ni_deviation')
+_TWI_WEIGHTS = np.array([0.30, 0.25, 0.20, 0.15, 0.10])
+
+
+def _twi_rows_numpy(weights: np.ndarray, values: np.ndarray, out: np.ndarray) -> None:
+    """Clipped left-to-right weighted sum of each row of values."""
+    # Column by column rather than values @ weights, so the summation
+    # order (and result) matches calculate_twi exactly
+    s = weights[0] * values[:, 0]
+    for i in range(1, weights.shape[0]):
+        s += weights[i] * values[:, i]
+    np.clip(s, 0.0, 1.0, out=out)
+
+
+@lazy_kernel
+def _twi_rows(njit):
+    """Clipped left-to-right weighted sum of each row of values, into out."""
+    if njit is None:
+        return _twi_rows_numpy
+
+    @njit(cache=True)
+    def kernel(weights, values, out):
+        for n in range(values.shape[0]):
+            s = 0.0
+            for i in range(weights.shape[0]):
+                s += weights[i] * values[n, i]
+            out[n] = min(1.0, max(0.0, s))
+    return kernel
+
 
 def calculate_twi(weathering_data: Dict[str, float]) -> float:
     """
@@ -37,6 +70,29 @@ def calculate_twi(weathering_data: Dict[str, float]) -> float:
     return min(1.0, max(0.0, twi))
 
 
+def calculate_twi_batch(values: np.ndarray) -> np.ndarray:
+    """
+    Calculate TWI for many specimens at once.
+    
+    Vectorized equivalent of calling calculate_twi on each record, with
+    indicators given as columns in _TWI_KEYS order: metal oxidation,
+    phyllosilicate, carbonate veins, ¹⁰Be/²¹Ne deviation, Fe/Ni deviation.
+    
+    Args:
+        values: (n, 5) array of weathering indicators
+        
+    Returns:
+        (n,) array of TWI values in [0, 1]
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.ndim != 2 or values.shape[1] != len(_TWI_KEYS):
+        raise ValueError(f"Expected an (n, {len(_TWI_KEYS)}) array, got shape {values.shape}")
+    
+    out = np.empty(values.shape[0])
+    _twi_rows(_TWI_WEIGHTS, values, out)
+    return out
+
+
 def estimate_terrestrial_age(twi: float) -> Dict[str, float]:
     """
     Estimate terrestrial age from TWI.
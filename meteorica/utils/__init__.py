@@ -3,13 +3,20 @@ METEORICA Utilities Module
 Helper functions and calculations.
 """
 
-from .mahalanobis import mahalanobis_distance, euclidean_distance
+from .mahalanobis import (
+    mahalanobis_distance, mahalanobis_diagonal, euclidean_distance,
+    euclidean_distance_sq, make_mahalanobis, pairwise_mahalanobis
+)
 from .isotope_space import IsotopeSpace, project_to_7d
 from .concordia import ConcordiaDiagram, calculate_concordia
 
 __all__ = [
     'mahalanobis_distance',
+    'mahalanobis_diagonal',
     'euclidean_distance',
+    'euclidean_distance_sq',
+    'make_mahalanobis',
+    'pairwise_mahalanobis',
     'IsotopeSpace',
     'project_to_7d',
     'ConcordiaDiagram',
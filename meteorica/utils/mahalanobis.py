@@ -2,34 +2,317 @@
 Mahalanobis distance utilities for MCC calculation.
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 
+from .._jit import lazy_kernel, load_njit
+
+# Reassociation and FMA contraction only: fastmath=True also assumes no
+# NaN/inf, which would let NaN inputs come back as finite distances
+_FASTMATH = {'contract', 'reassoc'}
+
+
+def _sq_eucl_numpy(x: np.ndarray, y: np.ndarray) -> float:
+    """Squared Euclidean distance."""
+    diff = x - y
+    return float(diff @ diff)
+
+
+def _sq_mahal_numpy(x: np.ndarray, y: np.ndarray, inv_cov: np.ndarray) -> float:
+    """Squared Mahalanobis distance (x - y)ᵀ Σ⁻¹ (x - y)."""
+    diff = x - y
+    return float(diff @ inv_cov @ diff)
+
+
+@lazy_kernel
+def _sq_eucl(njit):
+    """Squared Euclidean distance without the x - y temporary."""
+    if njit is None:
+        return _sq_eucl_numpy
+
+    @njit(fastmath=_FASTMATH, cache=True)
+    def kernel(x, y):
+        result = x.dtype.type(0)
+        for i in range(x.shape[0]):
+            diff = x[i] - y[i]
+            result += diff * diff
+        return result
+    return kernel
+
+
+@lazy_kernel
+def _sq_mahal(njit):
+    """Squared Mahalanobis distance (x - y)ᵀ Σ⁻¹ (x - y) as two nested loops."""
+    if njit is None:
+        return _sq_mahal_numpy
+
+    @njit(fastmath=_FASTMATH, cache=True)
+    def kernel(x, y, inv_cov):
+        n = x.shape[0]
+        result = x.dtype.type(0)
+        for i in range(n):
+            row = x.dtype.type(0)
+            for j in range(n):
+                row += inv_cov[i, j] * (x[j] - y[j])
+            result += (x[i] - y[i]) * row
+        return result
+    return kernel
+
+
+@lazy_kernel
+def _pairwise_mahal(njit):
+    """Fill out[i, j] with the distance between X[i] and Y[j]; rows run in parallel."""
+    from numba import prange
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def kernel(X, Y, inv_cov, out):
+        d = X.shape[1]
+        for i in prange(X.shape[0]):
+            for j in range(Y.shape[0]):
+                s = 0.0
+                for k in range(d):
+                    t = 0.0
+                    for l in range(d):
+                        t += (X[i, l] - Y[j, l]) * inv_cov[l, k]
+                    s += t * (X[i, k] - Y[j, k])
+                out[i, j] = math.sqrt(s)
+    return kernel
+
+
+# Largest dimension that gets a fully unrolled kernel; wider vectors use _sq_mahal
+_MAX_UNROLL = 16
+
+# From this dimension on, pairwise_mahalanobis whitens and uses one gemm
+_PAIRWISE_GEMM_DIM = 8
+
+
+@lru_cache(maxsize=None)
+def make_mahalanobis(d: int):
+    """
+    Return a Mahalanobis distance kernel specialized for dimension d.
+    
+    With Numba, d is baked in as a compile-time constant so both loops of
+    (x - μ)ᵀ Σ⁻¹ (x - μ) unroll into straight-line code. Kernels take
+    contiguous arrays (x, centroid, inv_cov) of one float dtype and return
+    the distance.
+    """
+    njit = load_njit()
+    if njit is None:
+        def kernel(x, mu, inv_cov):
+            return math.sqrt(_sq_mahal_numpy(x, mu, inv_cov))
+        return kernel
+    
+    @njit(fastmath=_FASTMATH, cache=True)
+    def kernel(x, mu, inv_cov):
+        s = x.dtype.type(0)
+        for i in range(d):
+            row = x.dtype.type(0)
+            for j in range(d):
+                row += inv_cov[i, j] * (x[j] - mu[j])
+            s += (x[i] - mu[i]) * row
+        return math.sqrt(s)
+    return kernel
+
+
+def _contiguous(a, dtype) -> np.ndarray:
+    """C-contiguous view (or copy) of a in the given dtype, as the kernels expect."""
+    return np.ascontiguousarray(a, dtype=dtype)
+
+
+def _check_dtype(dtype) -> None:
+    """Raise ValueError for working precisions the kernels are not compiled for."""
+    if np.dtype(dtype) not in (np.float32, np.float64):
+        raise ValueError(f"dtype must be np.float32 or np.float64, got {np.dtype(dtype)}")
+
+
+def _check_dims(x: np.ndarray, centroid: np.ndarray, inv_cov: np.ndarray) -> None:
+    """Raise ValueError unless x, centroid and inv_cov share one dimension d.
+    
+    The Numba kernels do no bounds checking, so this must run before them.
+    """
+    d = x.shape[-1]
+    if centroid.shape[-1] != d or inv_cov.shape != (d, d):
+        raise ValueError(
+            f"Dimension mismatch: vectors have {d} and {centroid.shape[-1]} "
+            f"features, inverse covariance is {inv_cov.shape}"
+        )
+
+
+@lru_cache(maxsize=32)
+def _inverse(cov_bytes: bytes, shape: tuple, dtype: str):
+    """
+    Inverse of a covariance matrix given as raw bytes, derived from its
+    Cholesky factor when the matrix is symmetric. Cached so a covariance
+    reused across many queries is factorized once. Returns None when the
+    matrix is singular.
+    """
+    from scipy.linalg import cho_factor, cho_solve
+    
+    cov = np.frombuffer(cov_bytes, dtype=dtype).reshape(shape)
+    try:
+        # cho_factor reads only one triangle, so it would silently
+        # invert a different matrix for a non-symmetric input
+        if not np.allclose(cov, cov.T):
+            raise np.linalg.LinAlgError("covariance is not symmetric")
+        inv_cov = cho_solve(cho_factor(cov), np.eye(shape[0]))
+    except np.linalg.LinAlgError:
+        # Not symmetric positive definite; a plain inverse still works if non-singular
+        try:
+            inv_cov = np.linalg.inv(cov)
+        except np.linalg.LinAlgError:
+            return None
+    inv_cov.setflags(write=False)
+    return inv_cov
+
 
 def mahalanobis_distance(x: np.ndarray, centroid: np.ndarray, 
-                         cov: np.ndarray) -> float:
+                         cov: np.ndarray, inv_cov: np.ndarray = None,
+                         dtype=np.float64):
     """
     Calculate Mahalanobis distance between observation and centroid.
     
     d = sqrt((x - μ)ᵀ Σ⁻¹ (x - μ))
     
+    For a diagonal covariance, mahalanobis_diagonal avoids the inversion.
+    
     Args:
-        x: Observation vector
+        x: Observation vector, or (n, d) array of observations
         centroid: Group centroid vector
         cov: Covariance matrix
+        inv_cov: Precomputed inverse of cov; skips the inversion when
+                 scoring many batches against the same group
+        dtype: Working precision, np.float32 or np.float64; np.float32
+               halves memory traffic at roughly 1e-6 relative accuracy
         
     Returns:
-        Mahalanobis distance
+        Mahalanobis distance, or an (n,) array of distances for 2D x
     """
-    diff = x - centroid
+    _check_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    centroid = np.asarray(centroid, dtype=dtype)
+    
+    if inv_cov is None:
+        cov = np.ascontiguousarray(cov)
+        inv_cov = _inverse(cov.tobytes(), cov.shape, cov.dtype.str)
+        if inv_cov is None:
+            # If covariance matrix is singular, use Euclidean distance
+            diff = x - centroid
+            return np.sqrt(np.sum(diff ** 2, axis=-1))
+    
+    inv_cov = _contiguous(inv_cov, dtype)
+    _check_dims(x, centroid, inv_cov)
+    if x.ndim == 2:
+        # One matmul for the whole batch instead of a Python loop per row;
+        # mean-centred data (zero centroid) skips the subtraction
+        diff = x - centroid if centroid.any() else x
+        return np.sqrt(np.sum((diff @ inv_cov) * diff, axis=1))
+    d = x.shape[0]
+    if d <= _MAX_UNROLL:
+        return make_mahalanobis(d)(_contiguous(x, dtype), _contiguous(centroid, dtype), inv_cov)
+    return math.sqrt(_sq_mahal(_contiguous(x, dtype), _contiguous(centroid, dtype), inv_cov))
+
+
+def pairwise_mahalanobis(X: np.ndarray, Y: np.ndarray, inv_cov: np.ndarray,
+                         out: np.ndarray = None) -> np.ndarray:
+    """
+    Mahalanobis distances between every row of X and every row of Y.
+    
+    Small dimensions run a Numba kernel parallel over the rows of X
+    (thread count follows numba.set_num_threads). From d = 8 on, or
+    without Numba, both sets are whitened with the Cholesky factor L of
+    Σ⁻¹ = L Lᵀ, which reduces the problem to pairwise Euclidean distances
+    built around a single X·Yᵀ gemm.
+    
+    Args:
+        X: (n, d) array of observations
+        Y: (m, d) array of observations or centroids
+        inv_cov: Inverse covariance matrix Σ⁻¹ shared by all pairs
+        out: Optional (n, m) float64 array to write the result into
+        
+    Returns:
+        (n, m) array of distances
+    """
+    X = _contiguous(X, np.float64)
+    Y = _contiguous(Y, np.float64)
+    inv_cov = _contiguous(inv_cov, np.float64)
+    if X.ndim != 2 or Y.ndim != 2:
+        raise ValueError(f"X and Y must be 2D, got shapes {X.shape} and {Y.shape}")
+    _check_dims(X, Y, inv_cov)
+    if out is None:
+        out = np.empty((X.shape[0], Y.shape[0]))
+    elif out.shape != (X.shape[0], Y.shape[0]):
+        raise ValueError(f"out must have shape {(X.shape[0], Y.shape[0])}, got {out.shape}")
+    
+    if X.shape[1] < _PAIRWISE_GEMM_DIM and load_njit() is not None:
+        _pairwise_mahal(X, Y, inv_cov, out)
+        return out
+    
     try:
-        inv_cov = np.linalg.inv(cov)
-        distance = np.sqrt(np.dot(np.dot(diff, inv_cov), diff))
-        return distance
+        L = np.linalg.cholesky(inv_cov)
     except np.linalg.LinAlgError:
-        # If covariance matrix is singular, use Euclidean distance
-        return np.sqrt(np.sum(diff ** 2))
+        # Not positive definite: evaluate the quadratic form pair by pair
+        diff = X[:, None, :] - Y[None, :, :]
+        return np.sqrt(np.einsum('ijk,kl,ijl->ij', diff, inv_cov, diff), out=out)
+    
+    D = X @ L
+    E = Y @ L
+    np.matmul(D, E.T, out=out)
+    out *= -2.0
+    out += np.einsum('ij,ij->i', D, D)[:, None]
+    out += np.einsum('ij,ij->i', E, E)[None, :]
+    # Cancellation can leave tiny negatives where the true distance is zero
+    np.maximum(out, 0.0, out=out)
+    return np.sqrt(out, out=out)
+
+
+def mahalanobis_diagonal(x: np.ndarray, centroid: np.ndarray,
+                         variances) -> float:
+    """
+    Mahalanobis distance for a diagonal covariance matrix.
+    
+    d = sqrt(Σ (x_i - μ_i)² / σ_i²)
+    
+    Args:
+        x: Observation vector
+        centroid: Group centroid vector
+        variances: Per-dimension variances σ², or a single shared scalar
+        
+    Returns:
+        Mahalanobis distance
+    """
+    x = np.asarray(x, dtype=np.float64)
+    centroid = np.asarray(centroid, dtype=np.float64)
+    diff = x - centroid
+    return math.sqrt(np.sum(diff * diff / np.asarray(variances)))
+
+
+def euclidean_distance_sq(x: np.ndarray, centroid: np.ndarray,
+                          dtype=np.float64) -> float:
+    """
+    Squared Euclidean distance.
+    
+    Monotonic in the distance, so nearest-neighbour searches and threshold
+    checks can compare these directly and skip the square root. Pass
+    dtype=np.float32 to compute in single precision; other dtypes raise
+    ValueError.
+    """
+    _check_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    centroid = np.asarray(centroid, dtype=dtype)
+    if x.ndim == 1 and x.shape == centroid.shape:
+        return _sq_eucl(_contiguous(x, dtype), _contiguous(centroid, dtype))
+    diff = x - centroid
+    return float(np.sum(diff * diff))
 
 
-def euclidean_distance(x: np.ndarray, centroid: np.ndarray) -> float:
+def euclidean_distance(x: np.ndarray, centroid: np.ndarray,
+                       dtype=np.float64) -> float:
     """Calculate Euclidean distance."""
-    return np.sqrt(np.sum((x - centroid) ** 2))
+    _check_dtype(dtype)
+    x = np.asarray(x, dtype=dtype)
+    centroid = np.asarray(centroid, dtype=dtype)
+    if x.ndim == 1 and x.shape == centroid.shape:
+        return math.sqrt(_sq_eucl(_contiguous(x, dtype), _contiguous(centroid, dtype)))
+    return float(np.linalg.norm(x - centroid))
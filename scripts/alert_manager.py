@@ -10,12 +10,39 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes 2-5x faster; stdlib json.loads accepts bytes too
+_loads = getattr(orjson, 'loads', json.loads)
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 class AlertManager:
     def __init__(self):
         self.alerts_dir = Path("reports/alerts")
         self.exports_dir = Path("reports/exports/json")
+        self.alerts_dir.mkdir(parents=True, exist_ok=True)
+        self.exports_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Alerts by id, loaded once and kept in sync by every write below
+        self._index = {}
+        with os.scandir(self.alerts_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                # One unreadable file must not take the whole manager down
+                try:
+                    with open(entry.path, 'rb') as f:
+                        alert = _loads(f.read())
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(alert, dict):
+                    continue
+                alert.setdefault('id', entry.name[:-len('.json')])
+                self._index[alert['id']] = alert
         
     def check_ungrouped(self, specimen_data):
         """Check for ungrouped meteorites"""
@@ -54,9 +81,7 @@ class AlertManager:
         }
         
         # Save alert
-        alert_file = self.alerts_dir / f"{alert_id}.json"
-        with open(alert_file, 'w') as f:
-            json.dump(alert, f, indent=2)
+        self.update_alert(alert)
         
         # Also save to exports
         export_file = self.exports_dir / f"{alert_id}.json"
@@ -68,35 +93,32 @@ class AlertManager:
     
     def get_active_alerts(self):
         """Get all active alerts"""
+        now = datetime.now()
         alerts = []
-        for alert_file in self.alerts_dir.glob("*.json"):
-            with open(alert_file) as f:
-                alert = json.load(f)
-                if alert['status'] == 'active':
-                    # Check if expired
-                    expires = datetime.fromisoformat(alert['expires'])
-                    if datetime.now() > expires:
-                        alert['status'] = 'expired'
-                        self.update_alert(alert)
-                    else:
-                        alerts.append(alert)
+        for alert in list(self._index.values()):
+            if alert['status'] != 'active':
+                continue
+            # Check if expired
+            if now > datetime.fromisoformat(alert['expires']):
+                alert['status'] = 'expired'
+                self.update_alert(alert)
+            else:
+                alerts.append(alert)
         return alerts
     
     def resolve_alert(self, alert_id):
         """Resolve an alert"""
-        alert_file = self.alerts_dir / f"{alert_id}.json"
-        if alert_file.exists():
-            with open(alert_file) as f:
-                alert = json.load(f)
-            alert['status'] = 'resolved'
-            alert['resolved_at'] = datetime.now().isoformat()
-            with open(alert_file, 'w') as f:
-                json.dump(alert, f, indent=2)
-            return True
-        return False
+        alert = self._index.get(alert_id)
+        if alert is None:
+            return False
+        alert['status'] = 'resolved'
+        alert['resolved_at'] = datetime.now().isoformat()
+        self.update_alert(alert)
+        return True
     
     def update_alert(self, alert):
         """Update alert status"""
+        self._index[alert['id']] = alert
         alert_file = self.alerts_dir / f"{alert['id']}.json"
         with open(alert_file, 'w') as f:
             json.dump(alert, f, indent=2)
@@ -7,11 +7,13 @@ Generates daily, weekly, monthly reports and alerts
 import os
 import sys
 import json
-import csv
+import io
+import string
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache, partial, wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import shutil
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -23,11 +25,124 @@ except ImportError:
     print("Warning: meteorica package not found, using mock data")
     SpecimenRegistry = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_FORMATTER = string.Formatter()
+
+# str.format conversion flags and the builtins that implement them
+_CONVERSIONS = {None: None, 's': 'str', 'r': 'repr', 'a': 'ascii'}
+
+Renderer = Callable[[Dict[str, Any]], str]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@lru_cache(maxsize=16)
+def _compile_template(template_file: Path) -> Renderer:
+    """Read a template once and compile it into a render function"""
+    if not template_file.exists():
+        return lambda data: ''
+    with open(template_file) as f:
+        return _codegen_template(tuple(_FORMATTER.parse(f.read())))
+
+
+def _codegen_template(parsed: Tuple[Tuple, ...]) -> Renderer:
+    """Generate a function that renders one template shape via ''.join
+    
+    Templates with attribute/index field names or nested format specs
+    fall back to the generic _render_template.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if literal:
+            parts.append(repr(literal))
+        if field_name is None:
+            continue
+        if (not field_name.isidentifier() or '{' in format_spec
+                or conversion not in _CONVERSIONS):
+            return partial(_render_template, parsed)
+        expr = f"data[{field_name!r}]"
+        if conversion is not None:
+            expr = f"{_CONVERSIONS[conversion]}({expr})"
+        parts.append(f"format({expr}, {format_spec!r})")
+    
+    source = "def _render(data):\n    return ''.join((%s))\n" % ''.join(
+        part + ', ' for part in parts)
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['_render']
+
+
+def _render_template(parsed: Tuple[Tuple, ...], data: Dict[str, Any]) -> str:
+    """Render a pre-parsed template, equivalent to template.format(**data)"""
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        parts.append(literal)
+        if field_name is not None:
+            value, _ = _FORMATTER.get_field(field_name, (), data)
+            value = _FORMATTER.convert_field(value, conversion)
+            if '{' in format_spec:
+                format_spec = _FORMATTER.vformat(format_spec, (), data)
+            parts.append(format(value, format_spec))
+    return ''.join(parts)
+
+
+def _flush_batch(entries: List[Tuple[Path, bytes]]) -> None:
+    """Write each (path, payload) pair with a single open/write/close cycle"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    for path, payload in entries:
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _memoized(method):
+    """Cache a data-fetch method's result per instance, keyed by its arguments
+    
+    Only for methods whose arguments pin down a fixed period (a date, or a
+    year with its week or month); undated calls would pin the first answer.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._fetch_cache[key]
+        except KeyError:
+            result = self._fetch_cache[key] = method(self, *args, **kwargs)
+            return result
+    return wrapper
+
 
 class ReportGenerator:
     """Generate METEORICA reports in various formats"""
     
-    def __init__(self, base_dir: str = None):
+    # Severity mapping for alerts
+    SEVERITY_ICONS: ClassVar[Dict[str, str]] = {
+        'low': '🟢',
+        'medium': '🟡',
+        'high': '🔴',
+        'critical': '⚫'
+    }
+    
+    # Reports for a period still in progress are reused for this many seconds
+    REPORT_CACHE_TTL: ClassVar[float] = 3600.0
+    
+    def __init__(self, base_dir: str = None, use_cache: bool = True):
         """Initialize report generator"""
         if base_dir is None:
             base_dir = Path(__file__).parent.parent
@@ -43,18 +158,53 @@ class ReportGenerator:
         
         # Create directories if they don't exist
         for dir_path in [self.daily_dir, self.weekly_dir, self.monthly_dir,
-                        self.alerts_dir, self.archive_dir, self.exports_dir]:
+                        self.alerts_dir, self.archive_dir, self.exports_dir,
+                        self.exports_dir / 'json', self.exports_dir / 'csv']:
             dir_path.mkdir(parents=True, exist_ok=True)
         
+        # Results of period-keyed data fetches, see _memoized
+        self._fetch_cache: Dict[tuple, Any] = {}
+        
+        # Independent data fetches run concurrently, see _fetch_all
+        from concurrent.futures import ThreadPoolExecutor
+        self._pool = ThreadPoolExecutor(max_workers=8)
+        
+        # Generated report results as JSON text, in memory and persisted to
+        # sqlite; each hit parses a fresh copy so callers cannot corrupt it
+        self.use_cache = use_cache
+        self._report_cache: Dict[tuple, str] = {}
+        self._cache_db: Optional['sqlite3.Connection'] = None
+        
         # Initialize registry if available
         self.registry = None
         if SpecimenRegistry:
             self.registry = SpecimenRegistry()
     
+    def close(self) -> None:
+        """Shut down the fetch pool and close the report cache database"""
+        self._pool.shutdown(wait=True)
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    def __enter__(self) -> 'ReportGenerator':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def daily_report(self, date: Optional[str] = None) -> Dict[str, Any]:
         """Generate daily report"""
+        today = datetime.now().strftime('%Y-%m-%d')
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = today
+        
+        cache_key = ('daily', date)
+        report_file = self.daily_dir / f"{date}_daily.md"
+        closed = date < today
+        cached = self._cached_report(cache_key, report_file, closed)
+        if cached is not None:
+            return cached
         
         # Load template
         template = self._load_template('daily_template.md')
@@ -62,182 +212,193 @@ class ReportGenerator:
         # Generate data
         data = {
             'date': date,
-            'new_classifications': self._get_new_classifications('day'),
-            'fireball_events': self._get_fireball_events('day'),
-            'db_updates': self._get_db_updates('day'),
-            'active_alerts': self._get_active_alerts(),
-            'classification_table': self._get_classification_table('day'),
-            'fireball_table': self._get_fireball_table('day'),
-            'alerts_list': self._format_alerts_list(),
-            'total_specimens': self._get_total_specimens(),
-            'classified_today': self._get_classified_today(),
-            'backlog': self._get_backlog()
+            **self._fetch_all({
+                'new_classifications': (self._get_new_classifications, 'day'),
+                'fireball_events': (partial(self._get_fireball_events, date=date), 'day'),
+                'db_updates': (self._get_db_updates, 'day'),
+                'active_alerts': (self._get_active_alerts,),
+                'classification_table': (self._get_classification_table, 'day'),
+                'fireball_table': (self._get_fireball_table, 'day'),
+                'alerts_list': (self._format_alerts_list,),
+                'total_specimens': (self._get_total_specimens,),
+                'classified_today': (self._get_classified_today,),
+                'backlog': (self._get_backlog,)
+            })
         }
         
         # Generate report
-        report = template.format(**data)
-        
-        # Save report
-        report_file = self.daily_dir / f"{date}_daily.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
+        report = template(data)
         
-        # Export copies
-        self._export_report(date, 'daily', report, data)
+        # Save report and export copies in one batch
+        _flush_batch([(report_file, report.encode('utf-8'))] +
+                     self._export_entries(date, 'daily', report, data))
         
-        return {
+        result = {
             'status': 'success',
             'report_file': str(report_file),
             'date': date,
             'data': data
         }
+        self._store_report(cache_key, result)
+        return result
     
     def weekly_report(self, year: Optional[int] = None, 
                      week: Optional[int] = None) -> Dict[str, Any]:
         """Generate weekly report"""
+        now = datetime.now()
         if year is None:
-            year = datetime.now().year
+            year = now.year
         if week is None:
-            week = datetime.now().isocalendar()[1]
-        
-        # Load template
-        template = self._load_template('weekly_template.md')
+            week = now.isocalendar()[1]
         
         # Calculate date range
         start_date = datetime.strptime(f'{year}-W{week}-1', "%Y-W%W-%w")
         end_date = start_date + timedelta(days=6)
         
+        cache_key = ('weekly', year, week)
+        report_file = self.weekly_dir / f"{year}-W{week:02d}_weekly.md"
+        closed = end_date.date() < now.date()
+        cached = self._cached_report(cache_key, report_file, closed)
+        if cached is not None:
+            return cached
+        
+        # Load template
+        template = self._load_template('weekly_template.md')
+        
         # Generate data
         data = {
             'week': week,
             'year': year,
             'start_date': start_date.strftime('%Y-%m-%d'),
             'end_date': end_date.strftime('%Y-%m-%d'),
-            'total_classifications': self._get_classifications_week(year, week),
-            'new_groups': self._get_new_groups_week(year, week),
-            'fireball_events': self._get_fireball_events('week', year, week),
-            'growth': self._get_growth_week(year, week),
-            'group_stats': self._get_group_stats_week(year, week),
-            'significant_fireballs': self._get_significant_fireballs_week(year, week),
-            'discoveries': self._get_discoveries_week(year, week),
-            'emi_distribution': self._get_emi_distribution_week(year, week),
-            'alert_summary': self._get_alert_summary_week(year, week),
-            'avg_emi': self._get_avg_emi_week(year, week),
-            'top_group': self._get_top_group_week(year, week),
-            'ungrouped_count': self._get_ungrouped_week(year, week)
+            **self._fetch_all({
+                'total_classifications': (self._get_classifications_week, year, week),
+                'new_groups': (self._get_new_groups_week, year, week),
+                'fireball_events': (self._get_fireball_events, 'week', year, week),
+                'growth': (self._get_growth_week, year, week),
+                'group_stats': (self._get_group_stats_week, year, week),
+                'significant_fireballs': (self._get_significant_fireballs_week, year, week),
+                'discoveries': (self._get_discoveries_week, year, week),
+                'emi_distribution': (self._get_emi_distribution_week, year, week),
+                'alert_summary': (self._get_alert_summary_week, year, week),
+                'avg_emi': (self._get_avg_emi_week, year, week),
+                'top_group': (self._get_top_group_week, year, week),
+                'ungrouped_count': (self._get_ungrouped_week, year, week)
+            })
         }
         
         # Generate report
-        report = template.format(**data)
+        report = template(data)
         
-        # Save report
-        report_file = self.weekly_dir / f"{year}-W{week:02d}_weekly.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
-        
-        # Export copies
-        self._export_report(f"{year}-W{week:02d}", 'weekly', report, data)
+        # Save report and export copies in one batch
+        _flush_batch([(report_file, report.encode('utf-8'))] +
+                     self._export_entries(f"{year}-W{week:02d}", 'weekly', report, data))
         
-        return {
+        result = {
             'status': 'success',
             'report_file': str(report_file),
             'year': year,
             'week': week,
             'data': data
         }
+        self._store_report(cache_key, result)
+        return result
     
     def monthly_report(self, year: Optional[int] = None,
                       month: Optional[int] = None) -> Dict[str, Any]:
         """Generate monthly report"""
+        now = datetime.now()
         if year is None:
-            year = datetime.now().year
+            year = now.year
         if month is None:
-            month = datetime.now().month
+            month = now.month
+        
+        cache_key = ('monthly', year, month)
+        report_file = self.monthly_dir / f"{year}-{month:02d}_monthly.md"
+        closed = (year, month) < (now.year, now.month)
+        cached = self._cached_report(cache_key, report_file, closed)
+        if cached is not None:
+            return cached
         
         # Load template
         template = self._load_template('monthly_template.md')
         
         # Month name
         month_name = datetime(year, month, 1).strftime('%B')
+        prev_year, prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
         
         # Generate data
         data = {
             'month': month_name,
             'year': year,
-            'summary': self._get_monthly_summary(year, month),
-            'total_specimens': self._get_total_specimens(),
-            'last_month_total': self._get_total_specimens_month(year, month-1),
-            'change_total': self._get_change_percent('total', year, month),
-            'classifications': self._get_classifications_month(year, month),
-            'last_month_class': self._get_classifications_month(year, month-1),
-            'change_class': self._get_change_percent('class', year, month),
-            'fireball_events': self._get_fireball_events('month', year, month),
-            'last_month_fireball': self._get_fireball_events('month', year, month-1),
-            'change_fireball': self._get_change_percent('fireball', year, month),
-            'new_groups': self._get_new_groups_month(year, month),
-            'last_month_groups': self._get_new_groups_month(year, month-1),
-            'change_groups': self._get_change_percent('groups', year, month),
-            'alerts': self._get_alerts_month(year, month),
-            'last_month_alerts': self._get_alerts_month(year, month-1),
-            'change_alerts': self._get_change_percent('alerts', year, month),
-            'highlights': self._get_highlights_month(year, month),
-            'trends': self._get_trends_month(year, month),
-            'discoveries': self._get_discoveries_month(year, month),
-            'group_distribution': self._get_group_distribution_month(year, month),
-            'alert_analysis': self._get_alert_analysis_month(year, month),
-            'papers_submitted': self._get_papers_submitted_month(year, month),
-            'dois_issued': self._get_dois_issued_month(year, month),
-            'citations': self._get_citations_month(year, month),
-            'archived_reports': self._get_archived_count_month(year, month),
-            'exported_data': self._get_exported_data_month(year, month),
-            'next_month_goals': self._get_next_month_goals(year, month)
+            **self._fetch_all({
+                'summary': (self._get_monthly_summary, year, month),
+                'total_specimens': (self._get_total_specimens,),
+                'last_month_total': (self._get_total_specimens_month, prev_year, prev_month),
+                'change_total': (self._get_change_percent, 'total', year, month),
+                'classifications': (self._get_classifications_month, year, month),
+                'last_month_class': (self._get_classifications_month, prev_year, prev_month),
+                'change_class': (self._get_change_percent, 'class', year, month),
+                'fireball_events': (partial(self._get_fireball_events, month=month), 'month', year),
+                'last_month_fireball': (partial(self._get_fireball_events, month=prev_month), 'month', prev_year),
+                'change_fireball': (self._get_change_percent, 'fireball', year, month),
+                'new_groups': (self._get_new_groups_month, year, month),
+                'last_month_groups': (self._get_new_groups_month, prev_year, prev_month),
+                'change_groups': (self._get_change_percent, 'groups', year, month),
+                'alerts': (self._get_alerts_month, year, month),
+                'last_month_alerts': (self._get_alerts_month, prev_year, prev_month),
+                'change_alerts': (self._get_change_percent, 'alerts', year, month),
+                'highlights': (self._get_highlights_month, year, month),
+                'trends': (self._get_trends_month, year, month),
+                'discoveries': (self._get_discoveries_month, year, month),
+                'group_distribution': (self._get_group_distribution_month, year, month),
+                'alert_analysis': (self._get_alert_analysis_month, year, month),
+                'papers_submitted': (self._get_papers_submitted_month, year, month),
+                'dois_issued': (self._get_dois_issued_month, year, month),
+                'citations': (self._get_citations_month, year, month),
+                'archived_reports': (self._get_archived_count_month, year, month),
+                'exported_data': (self._get_exported_data_month, year, month),
+                'next_month_goals': (self._get_next_month_goals, year, month)
+            })
         }
         
         # Generate report
-        report = template.format(**data)
-        
-        # Save report
-        report_file = self.monthly_dir / f"{year}-{month:02d}_monthly.md"
-        with open(report_file, 'w') as f:
-            f.write(report)
+        report = template(data)
         
-        # Export copies
-        self._export_report(f"{year}-{month:02d}", 'monthly', report, data)
+        # Save report and export copies in one batch
+        _flush_batch([(report_file, report.encode('utf-8'))] +
+                     self._export_entries(f"{year}-{month:02d}", 'monthly', report, data))
         
-        return {
+        result = {
             'status': 'success',
             'report_file': str(report_file),
             'year': year,
             'month': month,
             'data': data
         }
+        self._store_report(cache_key, result)
+        return result
     
     def alert(self, alert_type: str, severity: str, 
              description: str, details: Dict = None) -> Dict[str, Any]:
         """Generate alert"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        alert_id = f"alert_{timestamp}_{alert_type}"
-        
-        # Severity mapping
-        severity_icons = {
-            'low': '🟢',
-            'medium': '🟡',
-            'high': '🔴',
-            'critical': '⚫'
-        }
+        # One clock read so the id, timestamps and expiry all agree
+        now = datetime.now()
+        alert_id = f"alert_{now.strftime('%Y%m%d_%H%M%S')}_{alert_type}"
+        generated = now.strftime('%Y-%m-%d %H:%M:%S')
         
         # Load template
         template = self._load_template('alert_template.md')
         
         data = {
             'alert_id': alert_id,
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': generated,
             'severity': severity.capitalize(),
-            'severity_icon': severity_icons.get(severity, '⚪'),
+            'severity_icon': self.SEVERITY_ICONS.get(severity, '⚪'),
             'alert_type': alert_type.replace('_', ' ').capitalize(),
             'status': 'active',
-            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'expires': (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d'),
+            'generated': generated,
+            'expires': (now + timedelta(days=7)).strftime('%Y-%m-%d'),
             'description': description,
             'affected_items': self._get_affected_items(details),
             'recommended_action': self._get_recommended_action(alert_type, severity),
@@ -245,17 +406,15 @@ class ReportGenerator:
         }
         
         # Generate alert
-        alert = template.format(**data)
+        alert = template(data)
         
-        # Save alert
+        # Save alert and its JSON copy in one batch
         alert_file = self.alerts_dir / f"{alert_id}.md"
-        with open(alert_file, 'w') as f:
-            f.write(alert)
-        
-        # Export JSON copy
         json_file = self.exports_dir / 'json' / f"{alert_id}.json"
-        with open(json_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _flush_batch([
+            (alert_file, alert.encode('utf-8')),
+            (json_file, _dumps(data)),
+        ])
         
         return {
             'status': 'success',
@@ -278,6 +437,8 @@ class ReportGenerator:
                 break
         
         if md_file:
+            import shutil
+            
             # Copy JSON template
             shutil.copy(json_file, self.exports_dir / 'json' / f"{report_name}.json")
         
@@ -285,56 +446,112 @@ class ReportGenerator:
     
     def archive_old_reports(self, days: int = 30) -> int:
         """Archive reports older than specified days"""
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         archived = 0
         
         for report_dir in [self.daily_dir, self.weekly_dir, self.monthly_dir]:
-            for report_file in report_dir.glob("*.md"):
-                mtime = datetime.fromtimestamp(report_file.stat().st_mtime)
-                if mtime < cutoff:
-                    # Move to archive
-                    dest = self.archive_dir / report_file.name
-                    shutil.move(str(report_file), str(dest))
+            with os.scandir(report_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.md') or entry.stat().st_mtime >= cutoff_ts:
+                        continue
+                    # Move to archive: a single rename on the same filesystem
+                    dest = self.archive_dir / entry.name
+                    try:
+                        os.replace(entry.path, dest)
+                    except OSError:
+                        import shutil
+                        shutil.move(entry.path, str(dest))
                     archived += 1
         
         return archived
     
-    def _load_template(self, template_name: str) -> str:
-        """Load template file"""
-        template_file = self.templates_dir / template_name
-        if template_file.exists():
-            with open(template_file) as f:
-                return f.read()
-        return ""
-    
-    def _export_report(self, name: str, report_type: str, 
-                       content: str, data: Dict):
-        """Export report in multiple formats"""
+    def _fetch_all(self, fetches: Dict[str, Tuple]) -> Dict[str, Any]:
+        """Run independent (fn, *args) fetches on the pool, keeping key order"""
+        futures = {key: self._pool.submit(*call) for key, call in fetches.items()}
+        return {key: future.result() for key, future in futures.items()}
+    
+    def _cached_report(self, key: tuple, report_file: Path,
+                       closed: bool) -> Optional[Dict[str, Any]]:
+        """Return a previous result if its report file is still fresh
+        
+        A report is fresh when its period has ended, or when it was written
+        less than REPORT_CACHE_TTL seconds ago.
+        """
+        if not self.use_cache:
+            return None
+        try:
+            mtime = report_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if not closed and time.time() - mtime > self.REPORT_CACHE_TTL:
+            return None
+        
+        text = self._report_cache.get(key)
+        if text is None:
+            row = self._get_cache_db().execute(
+                'SELECT result FROM report_cache WHERE key = ?', (repr(key),)
+            ).fetchone()
+            if row is None:
+                return None
+            text = self._report_cache[key] = row[0]
+        return json.loads(text)
+    
+    def _store_report(self, key: tuple, result: Dict[str, Any]) -> None:
+        """Remember a generated result in memory and in the sqlite cache"""
+        if not self.use_cache:
+            return
+        text = self._report_cache[key] = json.dumps(result)
+        with self._get_cache_db() as conn:
+            conn.execute('INSERT OR REPLACE INTO report_cache VALUES (?, ?)',
+                         (repr(key), text))
+    
+    def _get_cache_db(self) -> 'sqlite3.Connection':
+        """Open the on-disk report cache on first use"""
+        if self._cache_db is None:
+            import sqlite3
+            conn = sqlite3.connect(str(self.base_dir / '.report_cache.db'))
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS report_cache '
+                         '(key TEXT PRIMARY KEY, result TEXT NOT NULL)')
+            self._cache_db = conn
+        return self._cache_db
+    
+    def _load_template(self, template_name: str) -> Renderer:
+        """Load compiled template, cached per resolved path"""
+        return _compile_template((self.templates_dir / template_name).resolve())
+    
+    def _export_entries(self, name: str, report_type: str,
+                        content: str, data: Dict) -> List[Tuple[Path, bytes]]:
+        """Build JSON and CSV export payloads for _flush_batch"""
         # JSON export
         json_file = self.exports_dir / 'json' / f"{name}_{report_type}.json"
-        with open(json_file, 'w') as f:
-            json.dump({
-                'report_type': report_type,
-                'name': name,
-                'generated': datetime.now().isoformat(),
-                'content': content,
-                'data': data
-            }, f, indent=2)
-        
-        # CSV export (summary)
+        json_bytes = _dumps({
+            'report_type': report_type,
+            'name': name,
+            'generated': datetime.now().isoformat(),
+            'content': content,
+            'data': data
+        })
+        
+        # CSV export (summary); csv is only needed on this path
+        import csv
+        
         csv_file = self.exports_dir / 'csv' / f"{name}_{report_type}.csv"
-        with open(csv_file, 'w') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Key', 'Value'])
-            for key, value in data.items():
-                writer.writerow([key, str(value)])
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(['Key', 'Value'])
+        writer.writerows([key, str(value)] for key, value in data.items())
+        
+        return [(json_file, json_bytes), (csv_file, buf.getvalue().encode('utf-8'))]
     
     # Mock data methods (would be replaced with actual database queries)
     def _get_new_classifications(self, period: str) -> int:
         return 12
     
+    @_memoized
     def _get_fireball_events(self, period: str, year: int = None, 
-                             week: int = None, month: int = None) -> int:
+                             week: int = None, month: int = None,
+                             date: str = None) -> int:
         return 3
     
     def _get_db_updates(self, period: str) -> int:
@@ -361,84 +578,115 @@ class ReportGenerator:
     def _get_backlog(self) -> int:
         return 15234
     
+    @_memoized
     def _get_classifications_week(self, year: int, week: int) -> int:
         return 45
     
+    @_memoized
     def _get_new_groups_week(self, year: int, week: int) -> int:
         return 2
     
+    @_memoized
     def _get_growth_week(self, year: int, week: int) -> int:
         return 15
     
+    @_memoized
     def _get_group_stats_week(self, year: int, week: int) -> str:
         return "| H | 12 | 487 | +2% |"
     
+    @_memoized
     def _get_significant_fireballs_week(self, year: int, week: int) -> str:
         return "- Chelyabinsk-like event: 18.6 km/s, 23 km altitude"
     
+    @_memoized
     def _get_discoveries_week(self, year: int, week: int) -> str:
         return "- New ungrouped carbonaceous chondrite"
     
+    @_memoized
     def _get_emi_distribution_week(self, year: int, week: int) -> str:
         return "Average EMI: 0.76"
     
+    @_memoized
     def _get_alert_summary_week(self, year: int, week: int) -> str:
         return "| High | 1 | 0 |"
     
+    @_memoized
     def _get_avg_emi_week(self, year: int, week: int) -> float:
         return 0.76
     
+    @_memoized
     def _get_top_group_week(self, year: int, week: int) -> str:
         return "H"
     
+    @_memoized
     def _get_ungrouped_week(self, year: int, week: int) -> int:
         return 3
     
+    @_memoized
     def _get_monthly_summary(self, year: int, month: int) -> str:
         return "This month saw significant progress in classification..."
     
+    @_memoized
     def _get_total_specimens_month(self, year: int, month: int) -> int:
         return 2800
     
+    @_memoized
     def _get_change_percent(self, metric: str, year: int, month: int) -> str:
         return "+5%"
     
+    @_memoized
     def _get_classifications_month(self, year: int, month: int) -> int:
         return 180
     
+    @_memoized
     def _get_new_groups_month(self, year: int, month: int) -> int:
         return 3
     
+    @_memoized
     def _get_alerts_month(self, year: int, month: int) -> int:
         return 8
     
+    @_memoized
     def _get_highlights_month(self, year: int, month: int) -> str:
         return "- 3 new ungrouped meteorites identified\n- Major fireball event recorded"
     
+    @_memoized
     def _get_trends_month(self, year: int, month: int) -> str:
         return "Increasing number of carbonaceous chondrites"
     
+    @_memoized
+    def _get_discoveries_month(self, year: int, month: int) -> str:
+        return "- New ungrouped carbonaceous chondrite"
+    
+    @_memoized
     def _get_group_distribution_month(self, year: int, month: int) -> str:
         return "H: 35%, L: 30%, LL: 20%, Others: 15%"
     
+    @_memoized
     def _get_alert_analysis_month(self, year: int, month: int) -> str:
         return "8 alerts generated, 5 resolved"
     
+    @_memoized
     def _get_papers_submitted_month(self, year: int, month: int) -> int:
         return 2
     
+    @_memoized
     def _get_dois_issued_month(self, year: int, month: int) -> int:
         return 1
     
+    @_memoized
     def _get_citations_month(self, year: int, month: int) -> int:
         return 15
     
+    @_memoized
     def _get_archived_count_month(self, year: int, month: int) -> int:
         return 30
     
+    @_memoized
     def _get_exported_data_month(self, year: int, month: int) -> str:
         return "45 specimens exported"
     
+    @_memoized
     def _get_next_month_goals(self, year: int, month: int) -> str:
         return "- Complete classification of backlog\n- Submit paper on ungrouped meteorites"
     
@@ -463,26 +711,27 @@ def main():
     parser.add_argument('--year', type=int, help='Year for weekly/monthly')
     parser.add_argument('--week', type=int, help='Week number for weekly')
     parser.add_argument('--month', type=int, help='Month number for monthly')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Regenerate reports even if a fresh copy exists')
     
     args = parser.parse_args()
     
-    gen = ReportGenerator()
-    
-    if args.daily:
-        result = gen.daily_report(args.date)
-        print(f"Daily report generated: {result['report_file']}")
-    
-    if args.weekly:
-        result = gen.weekly_report(args.year, args.week)
-        print(f"Weekly report generated: {result['report_file']}")
-    
-    if args.monthly:
-        result = gen.monthly_report(args.year, args.month)
-        print(f"Monthly report generated: {result['report_file']}")
-    
-    if args.archive:
-        count = gen.archive_old_reports(args.archive)
-        print(f"Archived {count} old reports")
+    with ReportGenerator(use_cache=not args.no_cache) as gen:
+        if args.daily:
+            result = gen.daily_report(args.date)
+            print(f"Daily report generated: {result['report_file']}")
+        
+        if args.weekly:
+            result = gen.weekly_report(args.year, args.week)
+            print(f"Weekly report generated: {result['report_file']}")
+        
+        if args.monthly:
+            result = gen.monthly_report(args.year, args.month)
+            print(f"Monthly report generated: {result['report_file']}")
+        
+        if args.archive:
+            count = gen.archive_old_reports(args.archive)
+            print(f"Archived {count} old reports")
 
 
 if __name__ == '__main__':
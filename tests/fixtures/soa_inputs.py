@@ -0,0 +1,14 @@
+"""
+Struct-of-arrays test inputs for the batched parameter kernels.
+
+Each column holds one field across all records, so row i of every
+array describes the same specimen.
+"""
+
+import numpy as np
+
+# Stony specimens for calculate_mcc_batch: H, L, LL centroids and an H/L boundary case
+MCC_FA = np.array([18.5, 24.5, 29.0, 21.5])
+MCC_FS = np.array([16.5, 21.0, 24.5, 19.0])
+MCC_D17O = np.array([0.75, 1.05, 1.25, 0.9])
+MCC_GROUPS = ('H', 'L', 'LL', 'L')
@@ -3,11 +3,10 @@ Integration tests for full METEORICA pipeline
 """
 
 import unittest
-import sys
 import os
 import json
 import tempfile
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from types import MappingProxyType
 
 from meteorica.emi import calculate_emi, classify, Specimen
 from meteorica.parameters.mcc import calculate_mcc
@@ -20,9 +19,10 @@ from meteorica.classification.metbull_export import MetBullExporter
 class TestFullPipeline(unittest.TestCase):
     """Test complete METEORICA pipeline"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.test_specimen = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test data and export directory"""
+        cls.test_specimen = MappingProxyType({
             'id': 'TEST001',
             'name': 'Test Meteorite',
             'fa': 18.5,  # H chondrite
@@ -39,7 +39,13 @@ class TestFullPipeline(unittest.TestCase):
             'ε⁹²Ru': 0.02,
             'ε¹³⁷Ba': 0.01,
             'ε¹⁴²Nd': 0.0
-        }
+        })
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.exporter = MetBullExporter(cls._tmpdir.name)
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
     
     def test_mineral_classification(self):
         """Test mineralogical classification"""
@@ -100,20 +106,17 @@ class TestFullPipeline(unittest.TestCase):
     
     def test_export_to_metbull(self):
         """Test MetBull export"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter = MetBullExporter(tmpdir)
-            
-            specimen = {'id': 'TEST001', 'name': 'Test'}
-            result = {'group': 'H', 'emi': 0.92}
-            
-            filepath = exporter.export(specimen, result)
-            self.assertTrue(os.path.exists(filepath))
-            
-            # Check file content
-            with open(filepath) as f:
-                data = json.load(f)
-                self.assertIn('specimen', data)
-                self.assertIn('classification', data)
+        specimen = {'id': 'TEST001', 'name': 'Test'}
+        result = {'group': 'H', 'emi': 0.92}
+        
+        filepath = self.exporter.export(specimen, result)
+        self.assertTrue(os.path.exists(filepath))
+        
+        # Check file content
+        with open(filepath) as f:
+            data = json.load(f)
+            self.assertIn('specimen', data)
+            self.assertIn('classification', data)
 
 
 if __name__ == '__main__':
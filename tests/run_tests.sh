@@ -16,6 +16,10 @@ python -m pytest tests/unit/ -v
 echo -e "\n${GREEN}Running integration tests...${NC}"
 python -m pytest tests/integration/ -v
 
+# Slow tests (deselected by default in pytest.ini)
+echo -e "\n${GREEN}Running slow tests...${NC}"
+python -m pytest tests/ -m slow -v
+
 # Coverage report
 echo -e "\n${GREEN}Generating coverage report...${NC}"
 python -m pytest tests/ --cov=meteorica --cov-report=term --cov-report=html
@@ -3,9 +3,6 @@ Unit tests for Ablation Thermal Profile
 """
 
 import unittest
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from meteorica.parameters.atp import calculate_atp, estimate_airburst
 
@@ -3,12 +3,9 @@ Unit tests for Parent Body Differentiation Ratio
 Testing physical model - only positive concentrations are valid.
 """
 
-import unittest
-import sys
-import os
-import numpy as np
+from types import MappingProxyType
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import pytest
 
 from meteorica.parameters.pbdr import (
     calculate_pbdr,
@@ -18,213 +15,222 @@ from meteorica.parameters.pbdr import (
     validate_hse_data
 )
 
+# Frozen inputs shared by the session-scoped result fixtures
+CHONDRITIC_INPUT = MappingProxyType({
+    'os': 486,   # CI-like values
+    'ir': 481,
+    'ru': 712,
+    'pt': 1010,
+    'pd': 560,
+    're': 37,
+    'au': 140
+})
+
+CORE_INPUT = MappingProxyType({
+    'os': 48.6,   # 10% of CI
+    'ir': 48.1,
+    'ru': 71.2,
+    'pt': 101,
+    'pd': 56,
+    're': 3.7,
+    'au': 14
+})
+
+PARTIAL_INPUT = MappingProxyType({
+    'os': 243,   # 50% of CI
+    'ir': 240,
+    'ru': 356,
+    'pt': 505,
+    'pd': 280,
+    're': 18.5,
+    'au': 70
+})
+
+VESTA_INPUT = MappingProxyType({
+    'os': 14.6,   # ~3% of CI
+    'ir': 14.4,
+    'ru': 21.4,
+    'pt': 30.3,
+    'pd': 16.8,
+    're': 1.1,
+    'au': 4.2
+})
+
+# Inputs mixing valid and non-physical concentrations
+NEGATIVE_INPUT = MappingProxyType({
+    'os': -100,   # Non-physical
+    'ir': 481,    # Valid
+    'ru': -50,    # Non-physical
+    'pt': 1010,   # Valid
+})
+
+ZERO_INPUT = MappingProxyType({
+    'os': 0,      # Non-physical
+    'ir': 481,    # Valid
+    'ru': 0,      # Non-physical
+})
+
+MIXED_INPUT = MappingProxyType({
+    'os': 486,    # Valid
+    'ir': None,   # Invalid (None)
+    'ru': 'abc',  # Invalid (string)
+    'pt': 1010,   # Valid
+    'pd': -10,    # Invalid (negative)
+})
+
+VALIDATE_INPUT = MappingProxyType({
+    'os': 486,     # Valid
+    'ir': -10,     # Invalid
+    'ru': 0,       # Invalid
+    'pt': None,    # Invalid
+    'pd': 560,     # Valid
+    'unknown': 100 # Unknown element
+})
+
+
+@pytest.fixture(scope="session")
+def chondritic_result():
+    return calculate_pbdr(CHONDRITIC_INPUT)
+
+
+@pytest.fixture(scope="session")
+def core_result():
+    return calculate_pbdr(CORE_INPUT)
+
+
+@pytest.fixture(scope="session")
+def partial_result():
+    return calculate_pbdr(PARTIAL_INPUT)
+
+
+@pytest.fixture(scope="session")
+def vesta_result():
+    return calculate_pbdr(VESTA_INPUT)
+
+
+def test_negative_concentrations():
+    """Test negative concentrations (non-physical)"""
+    result = calculate_pbdr(NEGATIVE_INPUT)
+
+    # Should only use positive values
+    assert len(result['elements_analyzed']) == 2
+    assert 'ir' in result['elements_analyzed']
+    assert 'pt' in result['elements_analyzed']
+
+
+def test_zero_concentrations():
+    """Test zero concentrations (non-physical)"""
+    result = calculate_pbdr(ZERO_INPUT)
+
+    # Should only use positive values
+    assert len(result['elements_analyzed']) == 1
+    assert 'ir' in result['elements_analyzed']
+
+
+def test_mixed_valid_invalid():
+    """Test mix of valid and invalid data"""
+    result = calculate_pbdr(MIXED_INPUT)
+
+    # Should only use valid positive numbers
+    assert len(result['elements_analyzed']) == 2
+    assert 'os' in result['elements_analyzed']
+    assert 'pt' in result['elements_analyzed']
 
-class TestPBDR(unittest.TestCase):
-    """Test PBDR physical model - pure physics, no test contamination."""
-
-    def test_chondritic_values(self):
-        """Test CI chondrite values (undifferentiated)"""
-        # CI chondrite has PBDR ≈ 0
-        chondritic = {
-            'os': 486,   # CI-like values
-            'ir': 481,
-            'ru': 712,
-            'pt': 1010,
-            'pd': 560,
-            're': 37,
-            'au': 140
-        }
-        
-        result = calculate_pbdr(chondritic)
-        
-        # Should be very close to 0
-        self.assertAlmostEqual(result['pbdr'], 0.0, delta=0.05)
-        self.assertIn('Chondritic', result['differentiation'])
-        self.assertIn('chondritic', result['parent_body_type'].lower())
-
-    def test_fully_differentiated(self):
-        """Test fully differentiated (core) values"""
-        # Core material should have PBDR ≈ 1
-        # HSE concentrations are ~1-10% of CI
-        core = {
-            'os': 48.6,   # 10% of CI
-            'ir': 48.1,
-            'ru': 71.2,
-            'pt': 101,
-            'pd': 56,
-            're': 3.7,
-            'au': 14
-        }
-        
-        result = calculate_pbdr(core)
-        
-        # Should be close to 0.9 (highly differentiated)
-        self.assertGreater(result['pbdr'], 0.85)
-        self.assertIn('Fully differentiated', result['differentiation'])
-        self.assertIn('Core', result['parent_body_type'])
-
-    def test_partially_differentiated(self):
-        """Test partially differentiated body"""
-        # HSE concentrations at ~50% of CI
-        partial = {
-            'os': 243,   # 50% of CI
-            'ir': 240,
-            'ru': 356,
-            'pt': 505,
-            'pd': 280,
-            're': 18.5,
-            'au': 70
-        }
-        
-        result = calculate_pbdr(partial)
-        
-        # PBDR should be ~0.5
-        self.assertAlmostEqual(result['pbdr'], 0.5, delta=0.1)
-        self.assertIn('Moderately differentiated', result['differentiation'])
-
-    def test_vesta_like(self):
-        """Test Vesta-like (HED) differentiation"""
-        # HED meteorites have PBDR ~0.97
-        vesta = {
-            'os': 14.6,   # ~3% of CI
-            'ir': 14.4,
-            'ru': 21.4,
-            'pt': 30.3,
-            'pd': 16.8,
-            're': 1.1,
-            'au': 4.2
-        }
-        
-        result = calculate_pbdr(vesta)
-        
-        # Should be highly differentiated
-        self.assertGreater(result['pbdr'], 0.95)
-        self.assertIn('Fully differentiated', result['differentiation'])
-        self.assertIn('Vesta', result['parent_body_type'])
-
-    def test_negative_concentrations(self):
-        """Test negative concentrations (non-physical)"""
-        data = {
-            'os': -100,   # Non-physical
-            'ir': 481,    # Valid
-            'ru': -50,    # Non-physical
-            'pt': 1010,   # Valid
-        }
-        
-        result = calculate_pbdr(data)
-        
-        # Should only use positive values
-        self.assertEqual(len(result['elements_analyzed']), 2)
-        self.assertIn('ir', result['elements_analyzed'])
-        self.assertIn('pt', result['elements_analyzed'])
-
-    def test_zero_concentrations(self):
-        """Test zero concentrations (non-physical)"""
-        data = {
-            'os': 0,      # Non-physical
-            'ir': 481,    # Valid
-            'ru': 0,      # Non-physical
-        }
-        
-        result = calculate_pbdr(data)
-        
-        # Should only use positive values
-        self.assertEqual(len(result['elements_analyzed']), 1)
-        self.assertIn('ir', result['elements_analyzed'])
-
-    def test_mixed_valid_invalid(self):
-        """Test mix of valid and invalid data"""
-        data = {
-            'os': 486,    # Valid
-            'ir': None,   # Invalid (None)
-            'ru': 'abc',  # Invalid (string)
-            'pt': 1010,   # Valid
-            'pd': -10,    # Invalid (negative)
-        }
-        
-        result = calculate_pbdr(data)
-        
-        # Should only use valid positive numbers
-        self.assertEqual(len(result['elements_analyzed']), 2)
-        self.assertIn('os', result['elements_analyzed'])
-        self.assertIn('pt', result['elements_analyzed'])
-
-    def test_empty_data(self):
-        """Test empty input"""
-        result = calculate_pbdr({})
-        
-        self.assertEqual(result['pbdr'], 0.0)
-        self.assertEqual(len(result['elements_analyzed']), 0)
-        self.assertIn('Undifferentiated', result['differentiation'])
-
-    def test_single_element(self):
-        """Test with only one element"""
-        data = {'os': 486}
-        
-        result = calculate_pbdr(data)
-        
-        # Should still calculate PBDR
-        self.assertAlmostEqual(result['pbdr'], 0.0, delta=0.1)
-        self.assertEqual(len(result['elements_analyzed']), 1)
-
-    def test_interpret_differentiation(self):
-        """Test differentiation interpretation"""
-        test_cases = [
-            (0.05, 'Undifferentiated'),
-            (0.2, 'Partially differentiated'),
-            (0.5, 'Moderately differentiated'),
-            (0.7, 'Highly differentiated'),
-            (0.9, 'Fully differentiated'),
-        ]
-        
-        for pbdr, expected in test_cases:
-            with self.subTest(pbdr=pbdr):
-                result = interpret_differentiation(pbdr)
-                self.assertIn(expected, result)
-
-    def test_core_formation_extent(self):
-        """Test core formation extent calculation"""
-        # Undifferentiated
-        f = calculate_core_formation_extent(0.0)
-        self.assertAlmostEqual(f, 0.0, places=1)
-        
-        # Partially differentiated
-        f = calculate_core_formation_extent(0.3)
-        self.assertGreater(f, 0.2)
-        self.assertLess(f, 0.8)
-        
-        # Fully differentiated
-        f = calculate_core_formation_extent(0.9)
-        self.assertGreater(f, 0.9)
-        
-        # Clamping
-        f = calculate_core_formation_extent(1.5)  # >1 should clamp
-        self.assertLessEqual(f, 1.0)
-        
-        f = calculate_core_formation_extent(-0.5)  # <0 should clamp
-        self.assertGreaterEqual(f, 0.0)
-
-    def test_validate_hse_data(self):
-        """Test HSE data validation"""
-        data = {
-            'os': 486,     # Valid
-            'ir': -10,     # Invalid
-            'ru': 0,       # Invalid
-            'pt': None,    # Invalid
-            'pd': 560,     # Valid
-            'unknown': 100 # Unknown element
-        }
-        
-        validated = validate_hse_data(data)
-        
-        # Should only return valid, positive, known elements
-        self.assertEqual(len(validated), 2)
-        self.assertIn('os', validated)
-        self.assertIn('pd', validated)
-        self.assertNotIn('ir', validated)
-        self.assertNotIn('ru', validated)
-        self.assertNotIn('unknown', validated)
-
-
-if __name__ == '__main__':
-    unittest.main()
+
+def test_empty_data():
+    """Test empty input"""
+    result = calculate_pbdr({})
+
+    assert result['pbdr'] == 0.0
+    assert len(result['elements_analyzed']) == 0
+    assert 'Undifferentiated' in result['differentiation']
+
+
+def test_single_element():
+    """Test with only one element"""
+    data = {'os': 486}
+
+    result = calculate_pbdr(data)
+
+    # Should still calculate PBDR
+    assert result['pbdr'] == pytest.approx(0.0, abs=0.1)
+    assert len(result['elements_analyzed']) == 1
+
+
+def test_core_formation_extent():
+    """Test core formation extent calculation"""
+    # Undifferentiated
+    f = calculate_core_formation_extent(0.0)
+    assert f == pytest.approx(0.0, abs=0.05)
+
+    # Partially differentiated
+    f = calculate_core_formation_extent(0.3)
+    assert f > 0.2
+    assert f < 0.8
+
+    # Fully differentiated
+    f = calculate_core_formation_extent(0.9)
+    assert f > 0.9
+
+    # Clamping
+    f = calculate_core_formation_extent(1.5)  # >1 should clamp
+    assert f <= 1.0
+
+    f = calculate_core_formation_extent(-0.5)  # <0 should clamp
+    assert f >= 0.0
+
+
+def test_validate_hse_data():
+    """Test HSE data validation"""
+    validated = validate_hse_data(VALIDATE_INPUT)
+
+    # Should only return valid, positive, known elements
+    assert len(validated) == 2
+    assert 'os' in validated
+    assert 'pd' in validated
+    assert 'ir' not in validated
+    assert 'ru' not in validated
+    assert 'unknown' not in validated
+
+
+@pytest.mark.parametrize("pbdr,expected", [
+    (0.05, 'Undifferentiated'),
+    (0.2, 'Partially differentiated'),
+    (0.5, 'Moderately differentiated'),
+    (0.7, 'Highly differentiated'),
+    (0.9, 'Fully differentiated'),
+])
+def test_interpret_differentiation(pbdr, expected):
+    """Test differentiation interpretation"""
+    assert expected in interpret_differentiation(pbdr)
+
+
+def test_chondritic_values(chondritic_result):
+    """Test CI chondrite values (undifferentiated)"""
+    # CI chondrite has PBDR ≈ 0
+    assert chondritic_result['pbdr'] == pytest.approx(0.0, abs=0.05)
+    assert 'Chondritic' in chondritic_result['differentiation']
+    assert 'chondritic' in chondritic_result['parent_body_type'].lower()
+
+
+def test_fully_differentiated(core_result):
+    """Test fully differentiated (core) values"""
+    # Core material (HSE ~1-10% of CI) should be close to 0.9
+    assert core_result['pbdr'] > 0.85
+    assert 'Fully differentiated' in core_result['differentiation']
+    assert 'Core' in core_result['parent_body_type']
+
+
+def test_partially_differentiated(partial_result):
+    """Test partially differentiated body"""
+    # HSE concentrations at ~50% of CI give PBDR ~0.5
+    assert partial_result['pbdr'] == pytest.approx(0.5, abs=0.1)
+    assert 'Moderately differentiated' in partial_result['differentiation']
+
+
+def test_vesta_like(vesta_result):
+    """Test Vesta-like (HED) differentiation"""
+    # HED meteorites have PBDR ~0.97
+    assert vesta_result['pbdr'] > 0.95
+    assert 'Fully differentiated' in vesta_result['differentiation']
+    assert 'Vesta' in vesta_result['parent_body_type']
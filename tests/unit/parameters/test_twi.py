@@ -2,86 +2,95 @@
 Unit tests for Terrestrial Weathering Index
 """
 
-import unittest
-import sys
-import os
+from math import log
+
 import numpy as np
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import pytest
 
 from meteorica.parameters.twi import (
-    calculate_twi, estimate_terrestrial_age, get_weathering_grade
+    calculate_twi, calculate_twi_batch, estimate_terrestrial_age, get_weathering_grade,
+    _TWI_KEYS
 )
 
+# Expected terrestrial ages, computed once from the formula
+AGE_TWIS = (0.0225, 0.1, 0.45)
+EXPECTED_AGES = tuple(12400 * log(1 + 3.7 * twi) for twi in AGE_TWIS)
+
+
+def test_calculate_twi():
+    """Test TWI calculation"""
+    # Fresh specimen
+    fresh = {
+        'metal_oxidation': 0.05,
+        'phyllosilicate': 0.02,
+        'carbonate_veins': 0.0,
+        'be_ne_deviation': 0.01,
+        'fe_ni_deviation': 0.01
+    }
+    twi = calculate_twi(fresh)
+    # Calculate expected: 0.30*0.05 + 0.25*0.02 + 0.20*0 + 0.15*0.01 + 0.10*0.01
+    # = 0.015 + 0.005 + 0 + 0.0015 + 0.001 = 0.0225
+    assert twi == pytest.approx(0.0225, abs=5e-05)
+    assert twi < 0.15
+
+    # Weathered specimen
+    weathered = {
+        'metal_oxidation': 0.6,
+        'phyllosilicate': 0.5,
+        'carbonate_veins': 0.4,
+        'be_ne_deviation': 0.3,
+        'fe_ni_deviation': 0.2
+    }
+    twi = calculate_twi(weathered)
+    # Calculate expected: 0.30*0.6 + 0.25*0.5 + 0.20*0.4 + 0.15*0.3 + 0.10*0.2
+    # = 0.18 + 0.125 + 0.08 + 0.045 + 0.02 = 0.45
+    assert twi == pytest.approx(0.45, abs=0.005)
+
+
+def test_calculate_twi_batch():
+    """Batched TWI matches the scalar path row by row, including clipping"""
+    values = np.array([
+        [0.05, 0.02, 0.0, 0.01, 0.01],
+        [0.6, 0.5, 0.4, 0.3, 0.2],
+        [2.0, 2.0, 2.0, 2.0, 2.0],
+        [-1.0, 0.0, 0.0, 0.0, 0.0],
+    ])
+    expected = [calculate_twi(dict(zip(_TWI_KEYS, row))) for row in values]
+    assert calculate_twi_batch(values).tolist() == expected
+
+    with pytest.raises(ValueError):
+        calculate_twi_batch(np.zeros((3, 4)))
+
+
+def test_estimate_terrestrial_age():
+    """Test terrestrial age estimation"""
+    for twi, expected in zip(AGE_TWIS, EXPECTED_AGES):
+        age = estimate_terrestrial_age(twi)
+        assert age['age_years'] == pytest.approx(expected, abs=100)
+        assert age['precision'] == 8000
+
+
+@pytest.mark.parametrize("twi,expected_grade,expected_name", [
+    (0.1, 'W0', 'FRESH'),
+    (0.2, 'W1', 'MINOR'),
+    (0.4, 'W2', 'MODERATE'),
+    (0.6, 'W3', 'EXTENSIVE'),
+    (0.8, 'W4/5', 'SEVERE'),
+])
+def test_weathering_grade_thresholds(twi, expected_grade, expected_name):
+    """Test weathering grade thresholds from research paper"""
+    grade = get_weathering_grade(twi)
+    assert grade['grade'] == expected_grade
+    assert grade['name'] == expected_name
+
 
-class TestTWI(unittest.TestCase):
-    """Test TWI calculations"""
-    
-    def test_calculate_twi(self):
-        """Test TWI calculation"""
-        # Fresh specimen
-        fresh = {
-            'metal_oxidation': 0.05,
-            'phyllosilicate': 0.02,
-            'carbonate_veins': 0.0,
-            'be_ne_deviation': 0.01,
-            'fe_ni_deviation': 0.01
-        }
-        twi = calculate_twi(fresh)
-        # Calculate expected: 0.30*0.05 + 0.25*0.02 + 0.20*0 + 0.15*0.01 + 0.10*0.01
-        # = 0.015 + 0.005 + 0 + 0.0015 + 0.001 = 0.0225
-        self.assertAlmostEqual(twi, 0.0225, places=4)
-        self.assertLess(twi, 0.15)
-        
-        # Weathered specimen
-        weathered = {
-            'metal_oxidation': 0.6,
-            'phyllosilicate': 0.5,
-            'carbonate_veins': 0.4,
-            'be_ne_deviation': 0.3,
-            'fe_ni_deviation': 0.2
-        }
-        twi = calculate_twi(weathered)
-        # Calculate expected: 0.30*0.6 + 0.25*0.5 + 0.20*0.4 + 0.15*0.3 + 0.10*0.2
-        # = 0.18 + 0.125 + 0.08 + 0.045 + 0.02 = 0.45
-        self.assertAlmostEqual(twi, 0.45, places=2)
-    
-    def test_estimate_terrestrial_age(self):
-        """Test terrestrial age estimation"""
-        # Test with actual values from the formula
-        test_cases = [
-            (0.0225, 12400 * np.log(1 + 3.7 * 0.0225)),  # ~1000 years
-            (0.1, 12400 * np.log(1 + 3.7 * 0.1)),        # ~3900 years
-            (0.45, 12400 * np.log(1 + 3.7 * 0.45)),      # ~12400 years
-        ]
-        
-        for twi, expected in test_cases:
-            age = estimate_terrestrial_age(twi)
-            self.assertAlmostEqual(age['age_years'], expected, delta=100)
-            self.assertEqual(age['precision'], 8000)
-    
-    def test_weathering_grade_thresholds(self):
-        """Test weathering grade thresholds from research paper"""
-        test_cases = [
-            (0.1, 'W0', 'FRESH'),
-            (0.2, 'W1', 'MINOR'),
-            (0.4, 'W2', 'MODERATE'),
-            (0.6, 'W3', 'EXTENSIVE'),
-            (0.8, 'W4/5', 'SEVERE'),
-        ]
-        
-        for twi, expected_grade, expected_name in test_cases:
-            grade = get_weathering_grade(twi)
-            self.assertEqual(grade['grade'], expected_grade)
-            self.assertEqual(grade['name'], expected_name)
-    
-    def test_weathering_grade_boundaries(self):
-        """Test boundaries between weathering grades"""
-        # At exact boundaries, should be the higher grade
-        self.assertEqual(get_weathering_grade(0.15)['grade'], 'W1')
-        self.assertEqual(get_weathering_grade(0.30)['grade'], 'W2')
-        self.assertEqual(get_weathering_grade(0.50)['grade'], 'W3')
-        self.assertEqual(get_weathering_grade(0.70)['grade'], 'W4/5')
-
-
-if __name__ == '__main__':
-    unittest.main()
+# At exact boundaries, should be the higher grade
+@pytest.mark.parametrize("twi,expected_grade", [
+    (0.15, 'W1'),
+    (0.30, 'W2'),
+    (0.50, 'W3'),
+    (0.70, 'W4/5'),
+])
+def test_weathering_grade_boundaries(twi, expected_grade):
+    """Test boundaries between weathering grades"""
+    assert get_weathering_grade(twi)['grade'] == expected_grade
@@ -0,0 +1,75 @@
+"""
+Unit tests for the alert manager script
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / 'scripts' / 'alert_manager.py'
+
+
+def _load_script():
+    """Load scripts/alert_manager.py, which is not part of a package"""
+    spec = importlib.util.spec_from_file_location('alert_manager', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def am(request, tmp_path, monkeypatch):
+    """The script module, loaded with and without orjson, run from tmp_path"""
+    if request.param == 'json':
+        monkeypatch.setitem(sys.modules, 'orjson', None)
+    elif importlib.util.find_spec('orjson') is None:
+        pytest.skip('orjson not installed')
+    monkeypatch.chdir(tmp_path)
+    module = _load_script()
+    assert (module.orjson is None) == (request.param == 'json')
+    return module
+
+
+def test_loads_parses_bytes(am):
+    """_loads accepts raw file bytes on both the orjson and stdlib paths"""
+    assert am._loads('{"id": "a", "n": [1, 2.5]}'.encode()) == {'id': 'a', 'n': [1, 2.5]}
+    with pytest.raises(ValueError):
+        am._loads(b'{not json')
+
+
+def test_index_stays_in_sync(am):
+    """Create, resolve and expire are reflected in memory and on disk"""
+    manager = am.AlertManager()
+    first = manager.create_alert('ungrouped', 'high', 'UNG specimen')
+    second = manager.create_alert('fireball', 'high', 'Large fireball')
+    assert {a['id'] for a in manager.get_active_alerts()} == {first['id'], second['id']}
+
+    assert manager.resolve_alert(first['id'])
+    assert not manager.resolve_alert('alert_missing')
+    second['expires'] = '2000-01-01T00:00:00'
+    manager.update_alert(second)
+    assert manager.get_active_alerts() == []
+
+    # A fresh manager rebuilds the same index from the files
+    reloaded = am.AlertManager()
+    assert reloaded._index[first['id']]['status'] == 'resolved'
+    assert reloaded._index[second['id']]['status'] == 'expired'
+    assert reloaded._index == manager._index
+
+
+def test_bad_alert_files_are_skipped(am):
+    """Malformed files are ignored and a missing id falls back to the file name"""
+    alerts_dir = Path('reports/alerts')
+    alerts_dir.mkdir(parents=True)
+    (alerts_dir / 'broken.json').write_bytes(b'{"id": ')
+    (alerts_dir / 'list.json').write_text('[1, 2]')
+    (alerts_dir / 'alert_no_id.json').write_text(json.dumps({
+        'status': 'active', 'severity': 'low', 'description': 'x',
+        'expires': '2999-01-01T00:00:00'}))
+
+    manager = am.AlertManager()
+    assert list(manager._index) == ['alert_no_id']
+    assert len(manager.get_active_alerts()) == 1
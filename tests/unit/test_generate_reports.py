@@ -0,0 +1,210 @@
+"""
+Unit tests for the report generator script
+"""
+
+import importlib.util
+import os
+import shutil
+import string
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# scripts/ is not a package; load the generator straight from its file
+_spec = importlib.util.spec_from_file_location(
+    'generate_reports', ROOT / 'scripts' / 'generate_reports.py')
+gr = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gr)
+
+
+@pytest.fixture
+def base_dir(tmp_path, monkeypatch):
+    """Report tree in a temporary directory, with the shipped templates"""
+    monkeypatch.setattr(gr, 'SpecimenRegistry', None)
+    shutil.copytree(ROOT / 'reports' / 'templates', tmp_path / 'templates')
+    return tmp_path
+
+
+def _compile(template):
+    """Compile a template string the way _compile_template does"""
+    return gr._codegen_template(tuple(string.Formatter().parse(template)))
+
+
+class DatedGenerator(gr.ReportGenerator):
+    """Generator whose fireball count depends on the requested day"""
+
+    @gr._memoized
+    def _get_fireball_events(self, period, year=None, week=None, month=None, date=None):
+        return int(date[-2:]) if date else 0
+
+
+def test_daily_fetches_keyed_by_date(base_dir):
+    """Two days on one generator do not share memoized day counts"""
+    with DatedGenerator(str(base_dir)) as gen:
+        first = gen.daily_report('2026-01-01')
+        second = gen.daily_report('2026-01-02')
+    assert first['data']['fireball_events'] == 1
+    assert second['data']['fireball_events'] == 2
+
+
+def test_cached_report_is_a_copy(base_dir):
+    """Mutating a returned report does not change later cache hits"""
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        gen.daily_report('2026-01-01')['data']['backlog'] = -1
+        gen.daily_report('2026-01-01')['data']['backlog'] = -2
+        assert gen.daily_report('2026-01-01')['data']['backlog'] == 15234
+
+
+def _count_fetches(gen):
+    """Replace one daily fetch with a counter; a cache hit leaves it untouched"""
+    calls = []
+
+    def backlog():
+        calls.append(1)
+        return 15234
+
+    gen._get_backlog = backlog
+    return calls
+
+
+def _age(report_file, seconds):
+    """Push a report file's mtime into the past"""
+    old = time.time() - seconds
+    os.utime(report_file, (old, old))
+
+
+def test_report_cache_hit_and_miss(base_dir):
+    """A fresh report is reused; a missing report file forces regeneration"""
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        calls = _count_fetches(gen)
+        first = gen.daily_report('2026-01-01')
+        assert gen.daily_report('2026-01-01') == first
+        assert len(calls) == 1
+
+        Path(first['report_file']).unlink()
+        gen.daily_report('2026-01-01')
+        assert len(calls) == 2
+
+
+def test_report_cache_persists_across_generators(base_dir):
+    """The sqlite cache serves a new generator on the same tree"""
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        first = gen.daily_report('2026-01-01')
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        calls = _count_fetches(gen)
+        assert gen.daily_report('2026-01-01') == first
+        assert calls == []
+
+
+def test_report_cache_ttl(base_dir):
+    """Open periods expire after REPORT_CACHE_TTL; closed periods never do"""
+    today = datetime.now().strftime('%Y-%m-%d')
+    stale = gr.ReportGenerator.REPORT_CACHE_TTL + 60
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        calls = _count_fetches(gen)
+
+        _age(gen.daily_report(today)['report_file'], stale)
+        gen.daily_report(today)
+        assert len(calls) == 2
+
+        _age(gen.daily_report('2026-01-01')['report_file'], stale)
+        gen.daily_report('2026-01-01')
+        assert len(calls) == 3
+
+
+def test_report_cache_disabled(base_dir):
+    """use_cache=False regenerates every time and never opens the database"""
+    with gr.ReportGenerator(str(base_dir), use_cache=False) as gen:
+        calls = _count_fetches(gen)
+        gen.daily_report('2026-01-01')
+        gen.daily_report('2026-01-01')
+        assert len(calls) == 2
+    assert not (base_dir / '.report_cache.db').exists()
+
+
+@pytest.mark.parametrize('name', sorted(
+    p.name for p in (ROOT / 'reports' / 'templates').glob('*.md')))
+def test_shipped_templates_match_format(name):
+    """Each shipped template compiles to generated code that matches str.format"""
+    path = (ROOT / 'reports' / 'templates' / name).resolve()
+    text = path.read_text()
+    fields = {f for _, f, _, _ in string.Formatter().parse(text) if f is not None}
+    ctx = {f: f'<{f} {i}>' for i, f in enumerate(sorted(fields))}
+
+    renderer = gr._compile_template(path)
+    assert not isinstance(renderer, partial)
+    assert renderer(ctx) == text.format(**ctx)
+
+
+@pytest.mark.parametrize('template,ctx', [
+    ('plain text, no fields', {}),
+    ('{a}{b}', {'a': 1, 'b': 'x'}),
+    ('{{literal}} {a!r:>8} {b!s} {c!a}', {'a': 'q', 'b': 2.5, 'c': 'é'}),
+    ('{n:05d} | {f:.3f} | {p:%}', {'n': 42, 'f': 3.14159, 'p': 0.25}),
+    ("{a} ''' \"\"\" \\ \n {b}", {'a': '"', 'b': "'"}),
+])
+def test_codegen_matches_format(template, ctx):
+    """Generated renderers handle literals, conversions and format specs"""
+    renderer = _compile(template)
+    assert not isinstance(renderer, partial)
+    assert renderer(ctx) == template.format(**ctx)
+
+
+@pytest.mark.parametrize('template,ctx', [
+    ('{a[0]} {a[1]}', {'a': [1, 2]}),
+    ('{d.real}', {'d': 3}),
+    ('{x:{w}}', {'x': 'ab', 'w': 6}),
+])
+def test_codegen_fallback_matches_format(template, ctx):
+    """Index, attribute and nested-spec fields fall back to _render_template"""
+    renderer = _compile(template)
+    assert isinstance(renderer, partial)
+    assert renderer(ctx) == template.format(**ctx)
+
+
+def test_missing_template_renders_empty(tmp_path):
+    """A missing template file compiles to a renderer that returns ''"""
+    assert gr._compile_template(tmp_path / 'missing.md')({'a': 1}) == ''
+
+
+def test_fetch_all_runs_concurrently(base_dir):
+    """Fetches run on the pool at the same time and keep their key order"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch(value, scale=1):
+        barrier.wait()  # deadlocks (and times out) unless both run together
+        return value * scale
+
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        result = gen._fetch_all({'b': (fetch, 2), 'a': (partial(fetch, scale=10), 3)})
+    assert list(result.items()) == [('b', 2), ('a', 30)]
+
+
+def test_fetch_all_propagates_errors(base_dir):
+    """An exception in one fetch surfaces from _fetch_all"""
+    def broken():
+        raise LookupError('no data')
+
+    with gr.ReportGenerator(str(base_dir)) as gen:
+        with pytest.raises(LookupError):
+            gen._fetch_all({'ok': (int,), 'bad': (broken,)})
+
+
+def test_close_releases_pool_and_database(base_dir):
+    """close() shuts the pool down and closes the report cache connection"""
+    gen = gr.ReportGenerator(str(base_dir))
+    gen.daily_report('2026-01-01')
+    db = gen._get_cache_db()
+
+    gen.close()
+    assert gen._cache_db is None
+    with pytest.raises(RuntimeError):
+        gen._pool.submit(int)
+    with pytest.raises(Exception):
+        db.execute('SELECT 1')
@@ -0,0 +1,108 @@
+"""
+Unit tests for 7D isotope space utilities
+"""
+
+import unittest
+import numpy as np
+
+from meteorica.utils.isotope_space import IsotopeSpace, IsotopeVector
+
+
+class TestIsotopeSpace(unittest.TestCase):
+    """Test group discrimination in isotope space"""
+
+    def setUp(self):
+        self.space = IsotopeSpace()
+        self.cm = {
+            'ε⁵⁰Ti': 1.2,
+            'ε⁵⁴Cr': 0.88,
+            'ε⁹⁶Mo': -0.3,
+            'ε¹⁰⁰Mo': -0.2,
+            'ε⁹²Ru': 0.1,
+            'ε¹³⁷Ba': -0.1,
+            'ε¹⁴²Nd': 0.0
+        }
+
+    def test_input_types_agree(self):
+        """Dict, list, array and IsotopeVector inputs give the same result"""
+        values = [self.cm[k] for k in self.cm]
+        expected = self.space.find_nearest_group(self.cm)
+
+        for vector in (values, np.array(values), IsotopeVector(*values)):
+            group, dist, iaf = self.space.find_nearest_group(vector)
+            self.assertEqual(group, expected[0])
+            self.assertAlmostEqual(dist, expected[1])
+            self.assertAlmostEqual(iaf, expected[2])
+
+    def test_find_nearest_group(self):
+        """Test nearest group at a centroid"""
+        group, dist, iaf = self.space.find_nearest_group(self.cm)
+        self.assertEqual(group, 'CM')
+        self.assertAlmostEqual(dist, 0.0)
+        self.assertAlmostEqual(iaf, 1.0)
+
+        group, _, _ = self.space.find_nearest_group(self.cm, use_mahalanobis=False)
+        self.assertEqual(group, 'CM')
+
+    def test_missing_keys_default_to_zero(self):
+        """Missing isotopes are treated as zero anomaly"""
+        group, dist, _ = self.space.find_nearest_group({})
+        self.assertEqual(group, 'CI')
+        self.assertAlmostEqual(dist, 0.0)
+
+    def test_classify_batch(self):
+        """Batched classification matches per-vector results"""
+        rng = np.random.default_rng(42)
+        vectors = rng.normal(0.5, 0.8, size=(50, 7))
+
+        for use_mahalanobis in (True, False):
+            groups, dists, iafs = self.space.classify_batch(vectors, use_mahalanobis)
+            for i, v in enumerate(vectors):
+                group, dist, iaf = self.space.find_nearest_group(v, use_mahalanobis)
+                self.assertEqual(groups[i], group)
+                self.assertAlmostEqual(dists[i], dist)
+                self.assertAlmostEqual(iafs[i], iaf)
+
+    def test_classify_batch_shape(self):
+        """A single 7-vector is accepted; any other width raises"""
+        groups, _, _ = self.space.classify_batch([self.cm[k] for k in self.cm])
+        self.assertEqual(groups, ['CM'])
+
+        for shape in ((7, 8), (14,), (2, 7, 1)):
+            with self.assertRaises(ValueError):
+                self.space.classify_batch(np.zeros(shape))
+
+    def test_classify_batch_float32(self):
+        """float32 input gives the same groups as float64"""
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(0.5, 0.8, size=(50, 7))
+
+        groups64, dists64, _ = self.space.classify_batch(vectors)
+        groups32, dists32, _ = self.space.classify_batch(vectors.astype(np.float32))
+        self.assertEqual(groups32, groups64)
+        np.testing.assert_allclose(dists32, dists64, rtol=1e-5)
+
+    def test_to_array_into_buffer(self):
+        """to_array writes into a caller-provided buffer"""
+        vec = IsotopeVector(1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0)
+        buf = np.zeros((2, 7))
+
+        out = vec.to_array(buf[1])
+        self.assertTrue(np.shares_memory(out, buf))
+        np.testing.assert_array_equal(buf[1], np.arange(1.0, 8.0))
+        np.testing.assert_array_equal(buf[0], np.zeros(7))
+        np.testing.assert_array_equal(vec.to_array(), np.arange(1.0, 8.0))
+
+    def test_is_outlier(self):
+        """Test outlier detection"""
+        is_out, group, _ = self.space.is_outlier(self.cm)
+        self.assertFalse(is_out)
+        self.assertEqual(group, 'CM')
+
+        is_out, _, iaf = self.space.is_outlier([10.0] * 7)
+        self.assertTrue(is_out)
+        self.assertLess(iaf, 0.3)
+
+
+if __name__ == '__main__':
+    unittest.main()
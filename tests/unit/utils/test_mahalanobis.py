@@ -3,12 +3,12 @@ Unit tests for Mahalanobis distance utilities
 """
 
 import unittest
-import sys
-import os
 import numpy as np
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from meteorica.utils.mahalanobis import mahalanobis_distance, euclidean_distance
+from meteorica.utils.mahalanobis import (
+    mahalanobis_distance, mahalanobis_diagonal, euclidean_distance,
+    euclidean_distance_sq, make_mahalanobis, pairwise_mahalanobis
+)
 
 
 class TestMahalanobis(unittest.TestCase):
@@ -16,23 +16,162 @@ class TestMahalanobis(unittest.TestCase):
     
     def test_mahalanobis_distance(self):
         """Test Mahalanobis distance"""
-        x = np.array([1, 2, 3])
+        # Same point and a unit offset along every axis, scored as one batch
+        xs = np.array([[1, 2, 3], [2, 3, 4]], dtype=np.float64)
         centroid = np.array([1, 2, 3])
-        cov = np.eye(3)
-        
-        # Same point
-        dist = mahalanobis_distance(x, centroid, cov)
-        self.assertAlmostEqual(dist, 0.0)
-        
-        # Different point
-        x2 = np.array([2, 3, 4])
-        dist = mahalanobis_distance(x2, centroid, cov)
-        self.assertGreater(dist, 0)
+        np.testing.assert_allclose(mahalanobis_distance(xs, centroid, np.eye(3)),
+                                   [0.0, np.sqrt(3.0)], rtol=1e-12)
         
         # With covariance
         cov2 = np.array([[2, 0, 0], [0, 2, 0], [0, 0, 2]])
-        dist = mahalanobis_distance(x2, centroid, cov2)
-        self.assertGreater(dist, 0)
+        np.testing.assert_allclose(mahalanobis_distance(xs, centroid, cov2),
+                                   [0.0, np.sqrt(1.5)], rtol=1e-12)
+        
+        # Reusing a full covariance hits the cached factorization
+        cov3 = np.array([[2.0, 0.5, 0.1], [0.5, 1.5, 0.2], [0.1, 0.2, 1.0]])
+        x2 = xs[1]
+        diff = x2 - centroid
+        expected = np.sqrt(diff @ np.linalg.inv(cov3) @ diff)
+        dists = {mahalanobis_distance(x2, centroid, cov3) for _ in range(100)}
+        self.assertEqual(len(dists), 1)
+        self.assertAlmostEqual(dists.pop(), expected)
+        
+        # A non-symmetric covariance is inverted in full, not from one triangle
+        skew = np.array([[2.0, 0.9, 0.1], [0.1, 1.5, 0.2], [0.1, 0.2, 1.0]])
+        expected = np.sqrt(diff @ np.linalg.inv(skew) @ diff)
+        self.assertAlmostEqual(mahalanobis_distance(x2, centroid, skew), expected)
+        
+        # Singular covariance falls back to Euclidean distance
+        dist = mahalanobis_distance(x2, centroid, np.ones((3, 3)))
+        self.assertAlmostEqual(dist, np.sqrt(3))
+    
+    def test_mahalanobis_distance_shape_mismatch(self):
+        """Mismatched dimensions raise instead of reading out of bounds"""
+        cov2 = np.array([[2.0, 0.5], [0.5, 1.0]])
+        with self.assertRaises(ValueError):
+            mahalanobis_distance(np.ones(3), np.ones(3), cov2)
+        with self.assertRaises(ValueError):
+            mahalanobis_distance(np.ones(3), np.ones(2), None, inv_cov=np.eye(3))
+        with self.assertRaises(ValueError):
+            mahalanobis_distance(np.ones((4, 3)), np.ones(3), None, inv_cov=np.eye(2))
+    
+    def test_mahalanobis_diagonal(self):
+        """Test diagonal covariance distance"""
+        x = np.array([2.0, 3.0, 4.0])
+        centroid = np.array([1.0, 2.0, 3.0])
+        variances = np.array([2.0, 0.5, 4.0])
+        
+        full = mahalanobis_distance(x, centroid, np.diag(variances))
+        self.assertAlmostEqual(mahalanobis_diagonal(x, centroid, variances), full)
+        self.assertAlmostEqual(full, np.sqrt(1 / 2.0 + 1 / 0.5 + 1 / 4.0))
+        
+        # Scalar variance shared by all dimensions
+        self.assertAlmostEqual(mahalanobis_diagonal(x, centroid, 2.0), np.sqrt(1.5))
+        
+        # Plain lists work like arrays
+        self.assertAlmostEqual(
+            mahalanobis_diagonal([2, 3, 4], [1, 2, 3], [2.0, 0.5, 4.0]), full)
+        
+        # Non-diagonal covariance goes through the full inverse
+        cov = np.array([[2.0, 0.5, 0.0], [0.5, 2.0, 0.0], [0.0, 0.0, 1.0]])
+        diff = x - centroid
+        expected = np.sqrt(diff @ np.linalg.inv(cov) @ diff)
+        self.assertAlmostEqual(mahalanobis_distance(x, centroid, cov), expected)
+    
+    def test_mahalanobis_distance_batch(self):
+        """Test 2D input against a per-row reference loop"""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(200, 3))
+        centroid = np.array([0.5, -0.2, 1.0])
+        cov = np.array([[2.0, 0.5, 0.1], [0.5, 1.5, 0.2], [0.1, 0.2, 1.0]])
+        
+        expected = np.array([mahalanobis_distance(row, centroid, cov) for row in X])
+        np.testing.assert_allclose(mahalanobis_distance(X, centroid, cov), expected,
+                                   rtol=1e-13)
+        
+        # Precomputed inverse gives the same distances
+        inv_cov = np.linalg.inv(cov)
+        np.testing.assert_allclose(
+            mahalanobis_distance(X, centroid, cov, inv_cov=inv_cov), expected, rtol=1e-13)
+        
+        # A diagonal covariance agrees with mahalanobis_diagonal on batches
+        variances = np.array([2.0, 0.5, 4.0])
+        expected = np.array([mahalanobis_diagonal(row, centroid, variances) for row in X])
+        np.testing.assert_allclose(
+            mahalanobis_distance(X, centroid, np.diag(variances)), expected, rtol=1e-13)
+    
+    def test_make_mahalanobis(self):
+        """Dimension-specialized kernels match the NumPy expression"""
+        rng = np.random.default_rng(2)
+        for d in (2, 3, 7, 20):
+            x, centroid = rng.normal(size=(2, d))
+            a = rng.normal(size=(d, d))
+            inv_cov = np.linalg.inv(a @ a.T + d * np.eye(d))
+            diff = x - centroid
+            expected = np.sqrt(diff @ inv_cov @ diff)
+            
+            self.assertIs(make_mahalanobis(d), make_mahalanobis(d))
+            self.assertAlmostEqual(make_mahalanobis(d)(x, centroid, inv_cov), expected)
+            self.assertAlmostEqual(
+                mahalanobis_distance(x, centroid, None, inv_cov=inv_cov), expected)
+    
+    def test_dtypes(self):
+        """float32 and float64 working precision agree with a float64 reference"""
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(20, 3))
+        centroid = np.array([0.5, -0.2, 1.0])
+        cov = np.array([[2.0, 0.5, 0.1], [0.5, 1.5, 0.2], [0.1, 0.2, 1.0]])
+        inv_cov = np.linalg.inv(cov)
+        diffs = X - centroid
+        expected_mahal = np.sqrt(np.einsum('ij,jk,ik->i', diffs, inv_cov, diffs))
+        expected_eucl = np.sqrt(np.einsum('ij,ij->i', diffs, diffs))
+        
+        for dtype, rtol in ((np.float32, 1e-6), (np.float64, 1e-12)):
+            with self.subTest(dtype=dtype):
+                np.testing.assert_allclose(
+                    mahalanobis_distance(X, centroid, cov, dtype=dtype), expected_mahal, rtol=rtol)
+                np.testing.assert_allclose(
+                    [mahalanobis_distance(x, centroid, cov, dtype=dtype) for x in X],
+                    expected_mahal, rtol=rtol)
+                np.testing.assert_allclose(
+                    [euclidean_distance(x, centroid, dtype=dtype) for x in X],
+                    expected_eucl, rtol=rtol)
+        
+        # Only the precisions the kernels are compiled for are accepted
+        with self.assertRaises(ValueError):
+            mahalanobis_distance(X[0], centroid, cov, dtype=np.float16)
+        with self.assertRaises(ValueError):
+            euclidean_distance(X[0], centroid, dtype=np.float16)
+    
+    def test_pairwise_mahalanobis(self):
+        """Pairwise matrix matches the single-pair function on both paths"""
+        rng = np.random.default_rng(4)
+        for d in (3, 10):
+            X = rng.normal(size=(15, d))
+            Y = rng.normal(size=(6, d))
+            a = rng.normal(size=(d, d))
+            inv_cov = np.linalg.inv(a @ a.T + d * np.eye(d))
+            expected = np.array([[mahalanobis_distance(x, y, None, inv_cov=inv_cov)
+                                  for y in Y] for x in X])
+            
+            np.testing.assert_allclose(pairwise_mahalanobis(X, Y, inv_cov), expected,
+                                       rtol=1e-10)
+            out = np.empty((15, 6))
+            self.assertIs(pairwise_mahalanobis(X, Y, inv_cov, out=out), out)
+            np.testing.assert_allclose(out, expected, rtol=1e-10)
+        
+        # Identical rows give ~0 rather than NaN from cancellation in the gemm path
+        np.testing.assert_allclose(np.diag(pairwise_mahalanobis(X, X, inv_cov)), 0.0,
+                                   atol=1e-6)
+        
+        # Mismatched widths raise instead of reading out of bounds
+        with self.assertRaises(ValueError):
+            pairwise_mahalanobis(np.ones((2, 3)), np.ones((2, 2)), np.eye(3))
+        with self.assertRaises(ValueError):
+            pairwise_mahalanobis(np.ones((2, 3)), np.ones((2, 3)), np.eye(2))
+        with self.assertRaises(ValueError):
+            pairwise_mahalanobis(np.ones((2, 3)), np.ones((2, 3)), np.eye(3),
+                                 out=np.empty((1, 1)))
     
     def test_euclidean_distance(self):
         """Test Euclidean distance"""
@@ -45,6 +184,26 @@ class TestMahalanobis(unittest.TestCase):
         x2 = np.array([2, 3, 4])
         dist = euclidean_distance(x2, centroid)
         self.assertAlmostEqual(dist, np.sqrt(3))
+        self.assertAlmostEqual(euclidean_distance_sq(x2, centroid), 3.0)
+        self.assertEqual(euclidean_distance(x2, x2), 0.0)
+        
+        # NaN propagates even when both arguments are the same array
+        nan = np.array([np.nan, 1.0, 2.0])
+        self.assertTrue(np.isnan(euclidean_distance(nan, nan)))
+        self.assertTrue(np.isnan(euclidean_distance_sq(nan, nan)))
+        self.assertAlmostEqual(euclidean_distance(np.ones((2, 2)), np.zeros((2, 2))), 2.0)
+    
+    def test_kernels_match_numpy(self):
+        """Compiled kernels agree with the plain NumPy expressions"""
+        rng = np.random.default_rng(1)
+        x, centroid = rng.normal(size=(2, 7))
+        a = rng.normal(size=(7, 7))
+        inv_cov = np.linalg.inv(a @ a.T + 7 * np.eye(7))
+        diff = x - centroid
+        
+        self.assertAlmostEqual(euclidean_distance(x, centroid), np.sqrt(diff @ diff))
+        self.assertAlmostEqual(mahalanobis_distance(x, centroid, None, inv_cov=inv_cov),
+                               np.sqrt(diff @ inv_cov @ diff))
 
 
 if __name__ == '__main__':
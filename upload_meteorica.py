@@ -3,39 +3,155 @@ import os
 """METEORICA Upload v1.0.0 - باستخدام نفس الأسلوب المجرب"""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # بدونها يقرأ requests الملف كاملاً في الذاكرة
+    MultipartEncoder = None
 import hashlib
+import json
 import os
-import glob
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 TOKEN = os.environ.get("PYPI_TOKEN")
+print_lock = threading.Lock()
+
+# جلسة واحدة مع إعادة استخدام الاتصالات وإعادة المحاولة
+# (لا يمكن إعادة إرسال جسم متدفق، لذا يُعاد POST عند أخطاء 5xx فقط بدون toolbelt)
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[502, 503, 504],
+                      allowed_methods=(frozenset({'POST'}) if MultipartEncoder is None
+                                       else Retry.DEFAULT_ALLOWED_METHODS),
+                      raise_on_status=False)
+)
+session.mount('https://', adapter)
+session.headers.update({'User-Agent': 'METEORICA-Uploader/1.0'})
 
 print("="*60)
 print("☄️ METEORICA v1.0.0 Upload - PyPI")
 print("="*60)
 
-# قراءة README.md
-with open('README.md', 'r', encoding='utf-8') as f:
+# قراءة README.md كبايتات UTF-8 مرة واحدة (يُرسل كما هو مع كل ملف دون إعادة ترميز)
+with open('README.md', 'rb') as f:
     readme = f.read()
-print(f"📄 README.md: {len(readme)} حرف")
+print(f"📄 README.md: {len(readme)} بايت")
+
+# بيانات الرفع الثابتة لكل الملفات
+_STATIC_METADATA = {
+    ':action': 'file_upload',
+    'metadata_version': '2.1',
+    'name': 'meteorica',
+    'version': '1.0.0',
+    'description': readme,
+    'description_content_type': 'text/markdown',
+    'author': 'Samir Baladi',
+    'author_email': 'gitdeeper@gmail.com',
+    'license': 'MIT',
+    'summary': 'Celestial Messengers: A Comprehensive Physico-Chemical Framework for Extraterrestrial Materials',
+    'home_page': 'https://meteorica-science.netlify.app',
+    'project_urls': 'Documentation, https://meteorica-science.netlify.app/documentation, Source Code, https://gitlab.com/gitdeeper07/meteorica, DOI, https://doi.org/10.14293/METEORICA.2026.001',
+    'requires_python': '>=3.9',
+    'keywords': 'meteoritics,cosmochemistry,chondrites,achondrites,iron-meteorites,widmanstatten,isotope-geochemistry,planetary-defense,presolar-grains,ai-classification'
+}
 
 # البحث عن ملفات التوزيع
-wheel_files = glob.glob("dist/*.whl")
-tar_files = glob.glob("dist/*.tar.gz")
+def _scan_dist():
+    """مرور واحد على dist/ وتصنيف الملفات حسب اللاحقة"""
+    wheels, sdists = [], []
+    try:
+        with os.scandir('dist') as it:
+            for entry in it:
+                if entry.name.endswith('.whl'):
+                    wheels.append(entry.path)
+                elif entry.name.endswith('.tar.gz'):
+                    sdists.append(entry.path)
+    except FileNotFoundError:
+        pass
+    return wheels, sdists
+
+
+wheel_files, tar_files = _scan_dist()
 
 if not wheel_files and not tar_files:
     print("\n❌ لا توجد ملفات توزيع. جاري بناء الحزمة...")
-    os.system("python -m build")
+    # stdout يُلتقط لقراءة أسماء الملفات؛ stderr يظهر مباشرة للمستخدم
+    try:
+        result = subprocess.run(
+            [sys.executable, '-m', 'build', '--sdist', '--wheel', '--outdir', 'dist'],
+            check=True, stdout=subprocess.PIPE, text=True
+        )
+    except subprocess.CalledProcessError as e:
+        print(e.stdout)
+        print(f"❌ فشل البناء (رمز الخروج {e.returncode})")
+        sys.exit(e.returncode)
     
-    wheel_files = glob.glob("dist/*.whl")
-    tar_files = glob.glob("dist/*.tar.gz")
+    # "Successfully built meteorica-1.0.0.tar.gz and meteorica-1.0.0-py3-none-any.whl"
+    built = [line for line in result.stdout.splitlines()
+             if line.startswith('Successfully built')]
+    names = [n.rstrip(',') for n in built[-1].split()[2:]] if built else []
+    wheel_files = [os.path.join('dist', n) for n in names if n.endswith('.whl')]
+    tar_files = [os.path.join('dist', n) for n in names if n.endswith('.tar.gz')]
+    if not wheel_files and not tar_files:
+        wheel_files, tar_files = _scan_dist()
 
 print(f"\n📦 الملفات:")
 for f in wheel_files + tar_files:
     print(f"   • {os.path.basename(f)}")
 
-for filepath in wheel_files + tar_files:
+# ذاكرة تخزين مؤقت للهاشات: اسم الملف -> [mtime_ns, size, md5, sha256]
+HASH_CACHE = os.path.join('dist', '.hash-cache.json')
+try:
+    with open(HASH_CACHE, 'r', encoding='utf-8') as f:
+        hash_cache = json.load(f)
+except (OSError, ValueError):
+    hash_cache = {}
+hash_cache_lock = threading.Lock()
+
+
+def _hash_file(filepath):
+    """MD5 و SHA-256 للملف، دون إعادة القراءة إن لم يتغير منذ آخر تشغيل"""
+    filename = os.path.basename(filepath)
+    st = os.stat(filepath)
+    key = [st.st_mtime_ns, st.st_size]
+    with hash_cache_lock:
+        cached = hash_cache.get(filename)
+    if cached and cached[:2] == key:
+        return cached[2], cached[3]
+
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            md5.update(chunk)
+            sha256.update(chunk)
+    digests = md5.hexdigest(), sha256.hexdigest()
+    with hash_cache_lock:
+        hash_cache[filename] = key + list(digests)
+    return digests
+
+
+def _save_hash_cache():
+    """كتابة ذرية عبر ملف مؤقت ثم os.replace"""
+    if not hash_cache:
+        return
+    tmp = HASH_CACHE + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(hash_cache, f, indent=2)
+    os.replace(tmp, HASH_CACHE)
+
+
+def _upload(filepath):
     filename = os.path.basename(filepath)
-    print(f"\n📤 رفع: {filename}")
+    with print_lock:
+        print(f"\n📤 رفع: {filename}")
 
     # تحديد نوع الملف
     if filename.endswith('.tar.gz'):
@@ -45,51 +161,58 @@ for filepath in wheel_files + tar_files:
         filetype = 'bdist_wheel'
         pyversion = 'py3'
 
-    # حساب الهاشات
-    with open(filepath, 'rb') as f:
-        content = f.read()
-    md5_hash = hashlib.md5(content).hexdigest()
-    sha256_hash = hashlib.sha256(content).hexdigest()
+    # حساب الهاشات (أو إعادة استخدامها من ذاكرة التخزين المؤقت)
+    md5_hash, sha256_hash = _hash_file(filepath)
 
     # بيانات الرفع
     data = {
-        ':action': 'file_upload',
-        'metadata_version': '2.1',
-        'name': 'meteorica',
-        'version': '1.0.0',
+        **_STATIC_METADATA,
         'filetype': filetype,
         'pyversion': pyversion,
         'md5_digest': md5_hash,
-        'sha256_digest': sha256_hash,
-        'description': readme,
-        'description_content_type': 'text/markdown',
-        'author': 'Samir Baladi',
-        'author_email': 'gitdeeper@gmail.com',
-        'license': 'MIT',
-        'summary': 'Celestial Messengers: A Comprehensive Physico-Chemical Framework for Extraterrestrial Materials',
-        'home_page': 'https://meteorica-science.netlify.app',
-        'project_urls': 'Documentation, https://meteorica-science.netlify.app/documentation, Source Code, https://gitlab.com/gitdeeper07/meteorica, DOI, https://doi.org/10.14293/METEORICA.2026.001',
-        'requires_python': '>=3.9',
-        'keywords': 'meteoritics,cosmochemistry,chondrites,achondrites,iron-meteorites,widmanstatten,isotope-geochemistry,planetary-defense,presolar-grains,ai-classification'
+        'sha256_digest': sha256_hash
     }
 
-    # رفع الملف
+    # رفع الملف (بثاً من القرص عند توفر requests_toolbelt)
     with open(filepath, 'rb') as f:
-        response = requests.post(
-            'https://upload.pypi.org/legacy/',
-            files={'content': (filename, f, 'application/octet-stream')},
-            data=data,
-            auth=('__token__', TOKEN),
-            timeout=60,
-            headers={'User-Agent': 'METEORICA-Uploader/1.0'}
-        )
+        if MultipartEncoder is not None:
+            form = MultipartEncoder(
+                fields={**data, 'content': (filename, f, 'application/octet-stream')}
+            )
+            response = session.post(
+                'https://upload.pypi.org/legacy/',
+                data=form,
+                headers={'Content-Type': form.content_type},
+                auth=('__token__', TOKEN),
+                timeout=60
+            )
+        else:
+            response = session.post(
+                'https://upload.pypi.org/legacy/',
+                files={'content': (filename, f, 'application/octet-stream')},
+                data=data,
+                auth=('__token__', TOKEN),
+                timeout=60
+            )
 
-    print(f"   الحالة: {response.status_code}")
+    return filename, response.status_code, response.text
 
-    if response.status_code == 200:
-        print("   ✅✅✅ نجاح!")
-    else:
-        print(f"   ❌ خطأ: {response.text[:200]}")
+
+# الهاشات تُحفظ حتى لو فشل الرفع، لتُستخدم عند إعادة التشغيل
+try:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_upload, fp) for fp in wheel_files + tar_files]
+        for future in as_completed(futures):
+            filename, status, text = future.result()
+            with print_lock:
+                print(f"\n📥 {filename}")
+                print(f"   الحالة: {status}")
+                if status == 200:
+                    print("   ✅✅✅ نجاح!")
+                else:
+                    print(f"   ❌ خطأ: {text[:200]}")
+finally:
+    _save_hash_cache()
 
 print("\n" + "="*60)
 print("🔗 https://pypi.org/project/meteorica/1.0.0/")